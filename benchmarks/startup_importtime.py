@@ -0,0 +1,104 @@
+"""
+Startup-time benchmark for the command-line interface.
+
+Runs a CLI stage under ``python -X importtime`` against a tiny generated
+codebase, reports the total and the slowest imports, and fails when a stage
+pulls in a dependency it does not need or exceeds the import time budget.
+
+Usage:
+    python benchmarks/startup_importtime.py [--stage extract] [--budget-ms 500] [--top 10]
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+RUN_SCRIPT = ROOT_DIR / "src" / "run.py"
+
+HEAVY_MODULES = ("langgraph", "langchain", "langchain_core", "langchain_openai", "networkx", "git")
+
+# Heavy modules each stage is allowed to import
+ALLOWED_HEAVY_MODULES: Dict[str, Tuple[str, ...]] = {
+    "extract": (),
+    "graph": ("networkx",),
+}
+
+SAMPLE_SOURCE = (
+    "class Greeter:\n"
+    "    def greet(self, name: str) -> str:\n"
+    "        return self.format(name)\n\n"
+    "    def format(self, name: str) -> str:\n"
+    "        return f'Hello, {name}'\n"
+)
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """Parse ``-X importtime`` output into (module, self_us, cumulative_us) tuples."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        imports.append((module.strip(), int(self_us), int(cumulative_us)))
+    return imports
+
+
+def run_stage(stage: str) -> Tuple[subprocess.CompletedProcess, List[Tuple[str, int, int]]]:
+    """Run a CLI stage under ``-X importtime`` against a generated codebase."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        codebase_dir = Path(tmp_dir) / "sample"
+        codebase_dir.mkdir()
+        (codebase_dir / "greeter.py").write_text(SAMPLE_SOURCE, encoding="utf-8")
+
+        result = subprocess.run(
+            [
+                sys.executable, "-X", "importtime", str(RUN_SCRIPT), stage,
+                "--path", str(codebase_dir), "--traces-dir", str(Path(tmp_dir) / "traces"),
+            ],
+            capture_output=True,
+            text=True,
+            cwd=tmp_dir,
+        )
+    return result, parse_importtime(result.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stage", choices=sorted(ALLOWED_HEAVY_MODULES), default="extract")
+    parser.add_argument("--budget-ms", type=float, default=500.0, help="Total import time budget.")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to show.")
+    args = parser.parse_args()
+
+    result, imports = run_stage(args.stage)
+    total_ms = sum(self_us for _, self_us, _ in imports) / 1000
+
+    print(f"Stage '{args.stage}': {len(imports)} modules imported in {total_ms:.1f} ms")
+    for module, _, cumulative_us in sorted(imports, key=lambda item: -item[2])[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {module}")
+
+    imported = {module.split(".")[0] for module, _, _ in imports}
+    unexpected = sorted(
+        module for module in HEAVY_MODULES
+        if module in imported and module not in ALLOWED_HEAVY_MODULES[args.stage]
+    )
+
+    failed = False
+    if result.returncode != 0:
+        print(f"FAIL: stage exited with code {result.returncode}")
+        failed = True
+    if unexpected:
+        print(f"FAIL: unexpected heavy imports: {', '.join(unexpected)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"FAIL: import time {total_ms:.1f} ms exceeds budget of {args.budget_ms:.1f} ms")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,11 +2,13 @@ import os
 from datetime import datetime
 from pathlib import Path
 from time import time
+from typing import Dict, Optional
 
 from langgraph.graph import END, START, StateGraph
 from nodes.analyzing import AnalyzeNode
 from nodes.extracting import ExtractNode
 from nodes.reporting import ReportNode
+from nodes.streaming import StreamAnalyzeNode
 from state.code_analysis import CodeAnalysisState
 from utils.clients import OpenAIClient
 from utils.tools import Helper
@@ -15,16 +17,21 @@ from utils.tools import Helper
 class SummaryGeneratorAgent:
     """An agent, which builds and runs DAG flow for analyzing Python codebase and producing business requirements overview."""
 
-    def __init__(self) -> None:
-        self.CLONE_DIR = Path(os.getenv("CLONE_DIR_PATH"))
-        self.REPORT_DIR = Path(os.getenv("REPORT_DIR_PATH"))
-        self.TRACES_DIR = Path(os.getenv("TRACES_DIR_PATH"))
+    def __init__(
+        self,
+        clone_dir: Optional[Path] = None,
+        report_dir: Optional[Path] = None,
+        traces_dir: Optional[Path] = None,
+    ) -> None:
+        self.CLONE_DIR = Path(clone_dir or os.getenv("CLONE_DIR_PATH"))
+        self.REPORT_DIR = Path(report_dir or os.getenv("REPORT_DIR_PATH"))
+        self.TRACES_DIR = Path(traces_dir or os.getenv("TRACES_DIR_PATH"))
 
     @staticmethod
-    def _get_graph_builder() -> StateGraph:
-        extract_node = ExtractNode()
-        analyzer_node = AnalyzeNode(OpenAIClient.get_instance())
-        reporter_node = ReportNode(OpenAIClient.get_instance())
+    def _get_graph_builder(sharding_options: Optional[Dict] = None) -> StateGraph:
+        extract_node = ExtractNode(sharding_options)
+        analyzer_node = AnalyzeNode(OpenAIClient.get_tier("fast"))
+        reporter_node = ReportNode(OpenAIClient.get_tier("strong"))
 
         graph_builder = StateGraph(CodeAnalysisState)
         graph_builder.add_node("extract", extract_node)
@@ -38,36 +45,83 @@ class SummaryGeneratorAgent:
 
         return graph_builder
 
-    def run(self) -> None:
-        Helper.create_if_not_exists(self.CLONE_DIR)
+    @staticmethod
+    def _get_streaming_graph_builder(**streaming_options) -> StateGraph:
+        stream_analyze_node = StreamAnalyzeNode(OpenAIClient.get_tier("fast"), **streaming_options)
+        reporter_node = ReportNode(OpenAIClient.get_tier("strong"))
+
+        graph_builder = StateGraph(CodeAnalysisState)
+        graph_builder.add_node("extract_analyze", stream_analyze_node)
+        graph_builder.add_node("report", reporter_node)
+
+        graph_builder.add_edge(START, "extract_analyze")
+        graph_builder.add_edge("extract_analyze", "report")
+        graph_builder.add_edge("report", END)
+
+        return graph_builder
+
+    def analyze(
+        self,
+        codebase_local_dir_path: Path,
+        report_name: str,
+        streaming: bool = False,
+        sharding_options: Optional[Dict] = None,
+        **streaming_options,
+    ) -> Path:
+        """
+        Run the full DAG flow over a local codebase directory.
+
+        Args:
+            codebase_local_dir_path (Path): Path to the local codebase directory.
+            report_name (str): Name of the report file.
+            streaming (bool): Whether to overlap extraction with LLM analysis.
+            sharding_options (Optional[Dict]): Arguments of extract_sharded, not supported when streaming.
+            **streaming_options: Options of the StreamAnalyzeNode.
+
+        Returns:
+            Path: Path to the generated report file.
+        """
         Helper.create_if_not_exists(self.REPORT_DIR)
         Helper.create_if_not_exists(self.TRACES_DIR)
 
-        state_graph = self._get_graph_builder().compile()
+        repo_name = Path(codebase_local_dir_path).name
+        report_local_file_path = self.REPORT_DIR / repo_name / Helper.ensure_extension(report_name, "md")
 
-        try:
-            ssh_link = Helper.validate_ssh_link(input("Provide ssh link to remote repository: "))
+        if streaming and sharding_options:
+            raise ValueError("Sharded extraction cannot be combined with streaming")
+
+        if streaming:
+            state_graph = self._get_streaming_graph_builder(**streaming_options).compile()
+        else:
+            state_graph = self._get_graph_builder(sharding_options).compile()
+        state_graph.invoke({
+            "traces_local_dir_path": self.TRACES_DIR / f"{repo_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            "codebase_local_dir_path": Path(codebase_local_dir_path),
+            "report_local_file_path": report_local_file_path
+        })
 
-            repo_name = ssh_link.split(":")[-1].split("/")[-1]
-            report_name = Helper.ensure_extension(input("Provide report name: "), "md")
-            codebase_local_dir_path = self.CLONE_DIR / repo_name
+        return report_local_file_path
 
-            Helper.ssh_clone_repository(ssh_link, codebase_local_dir_path)
+    def clone(self, ssh_link: str) -> Path:
+        """Validate the SSH link and clone the repository into the clone directory."""
+        return Helper.clone_repository(ssh_link, self.CLONE_DIR)
+
+    def run(self) -> None:
+        try:
+            codebase_local_dir_path = self.clone(input("Provide ssh link to remote repository: "))
+            report_name = input("Provide report name: ")
 
-            print(f"Starting analysis of {repo_name}...")
+            print(f"Starting analysis of {codebase_local_dir_path.name}...")
 
             start_time = time()
-            state_graph.invoke({
-                "traces_local_dir_path": self.TRACES_DIR / f"{repo_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                "codebase_local_dir_path": codebase_local_dir_path,
-                "report_local_file_path": self.REPORT_DIR / repo_name / report_name
-            })
+            report_local_file_path = self.analyze(codebase_local_dir_path, report_name)
             end_time = time()
 
             execution_time = end_time - start_time
             print(
                 f"Analysis completed in {execution_time:.2f} seconds. "
-                f"You could find the report in {self.REPORT_DIR / repo_name / report_name}"
+                f"You could find the report in {report_local_file_path}"
             )
+            print(OpenAIClient.usage_to_string())
         except Exception as e:
-            print(f"Error! {e}")
\ No newline at end of file
+            print(f"Error! {e}")
@@ -0,0 +1,373 @@
+"""
+Non-interactive command-line interface for the analysis pipeline.
+
+Every stage is exposed as a subcommand (extract, graph, analyze, report, all).
+Heavy dependencies (networkx, langchain, langgraph, GitPython) are imported
+inside the stage handlers, so a stage only pays the import cost of what it
+actually runs.
+"""
+
+import argparse
+import os
+from datetime import datetime
+from pathlib import Path
+from time import time
+from typing import Dict, List, Optional
+
+STAGES = ("extract", "graph", "analyze", "report", "all", "worker")
+
+
+def _positive_int(value: str) -> int:
+    """Parse an integer argument, which must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def _positive_float(value: str) -> float:
+    """Parse a number of seconds, which must be greater than 0."""
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
+def _add_codebase_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add arguments selecting the codebase to analyze and the traces directory."""
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--path", type=Path, help="Path to a local codebase directory.")
+    source.add_argument("--repo", help="SSH link to a remote repository to clone.")
+    parser.add_argument(
+        "--clone-dir",
+        type=Path,
+        default=os.getenv("CLONE_DIR_PATH", "clones"),
+        help="Directory where remote repositories are cloned (default: $CLONE_DIR_PATH).",
+    )
+    parser.add_argument(
+        "--traces-dir",
+        type=Path,
+        default=os.getenv("TRACES_DIR_PATH", "traces"),
+        help="Directory for intermediate outputs (default: $TRACES_DIR_PATH).",
+    )
+
+
+def _add_sharding_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add arguments enabling sharded extraction across worker processes or hosts."""
+    parser.add_argument(
+        "--shards", type=int, default=0,
+        help="Split extraction into size-balanced shards handed out to workers (default: off).",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Number of local worker processes (default: one per shard).",
+    )
+    parser.add_argument(
+        "--shard-timeout", type=_positive_float, default=600.0,
+        help="Seconds to wait for a shard before retrying it on another worker (default: 600).",
+    )
+    parser.add_argument(
+        "--listen", default="127.0.0.1:0",
+        help="HOST:PORT the coordinator listens on for remote workers, "
+             "which authenticate with $SHARD_AUTHKEY (default: 127.0.0.1:0).",
+    )
+
+
+def _add_report_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add arguments describing where the report is written."""
+    parser.add_argument(
+        "--report-dir",
+        type=Path,
+        default=os.getenv("REPORT_DIR_PATH", "reports"),
+        help="Directory where reports are written (default: $REPORT_DIR_PATH).",
+    )
+    parser.add_argument("--report-name", default="report.md", help="Report file name.")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser with one subcommand per pipeline stage."""
+    parser = argparse.ArgumentParser(
+        prog="codebase-analyzer",
+        description="Analyze a Python codebase and produce a business requirements overview.",
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="{" + ",".join(STAGES) + "}")
+
+    extract_parser = subparsers.add_parser("extract", help="Extract classes and methods using AST parsers.")
+    _add_codebase_arguments(extract_parser)
+    _add_sharding_arguments(extract_parser)
+
+    graph_parser = subparsers.add_parser("graph", help="Extract, build the methods graph and find invocation paths.")
+    _add_codebase_arguments(graph_parser)
+    _add_sharding_arguments(graph_parser)
+
+    analyze_parser = subparsers.add_parser("analyze", help="Extract, build the graph and analyze it with LLM.")
+    _add_codebase_arguments(analyze_parser)
+    _add_sharding_arguments(analyze_parser)
+
+    report_parser = subparsers.add_parser("report", help="Build a report from a saved LLM analysis.")
+    report_parser.add_argument(
+        "--analysis", type=Path, required=True, help="Path to a saved analysis (llm_analyze.txt)."
+    )
+    report_parser.add_argument(
+        "--snapshot", type=Path,
+        help="Path to the graph snapshot (methods_graph.snap) paths, tables and links are rendered from "
+             "(default: extracting_output/methods_graph.snap next to the analysis).",
+    )
+    _add_report_arguments(report_parser)
+
+    all_parser = subparsers.add_parser("all", help="Run the full flow: extract, analyze and report.")
+    _add_codebase_arguments(all_parser)
+    _add_sharding_arguments(all_parser)
+    _add_report_arguments(all_parser)
+    all_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Analyze packages with LLM while the rest of the codebase is still parsed.",
+    )
+    all_parser.add_argument(
+        "--min-component-classes", type=_positive_int, default=20,
+        help="Minimum number of classes in a streamed component (default: 20).",
+    )
+    all_parser.add_argument(
+        "--max-queued-components", type=_positive_int, default=4,
+        help="Maximum number of parsed components waiting for analysis (default: 4).",
+    )
+    all_parser.add_argument(
+        "--max-concurrency", type=_positive_int, default=4,
+        help="Maximum number of concurrent LLM requests when streaming (default: 4).",
+    )
+
+    worker_parser = subparsers.add_parser(
+        "worker", help="Run an extraction worker for a coordinator started with --shards."
+    )
+    worker_parser.add_argument(
+        "--coordinator", required=True,
+        help="HOST:PORT of the coordinator, authenticated with $SHARD_AUTHKEY.",
+    )
+
+    return parser
+
+
+def _shard_authkey() -> Optional[bytes]:
+    """Return the key shared between the coordinator and remote workers, if configured."""
+    authkey = os.getenv("SHARD_AUTHKEY")
+    return authkey.encode() if authkey else None
+
+
+def _sharding_options(args: argparse.Namespace) -> Dict:
+    """Return keyword arguments of extract_sharded from the sharding arguments."""
+    from utils.sharding import parse_address
+
+    return {
+        "num_shards": args.shards,
+        "num_local_workers": args.workers,
+        "address": parse_address(args.listen),
+        "authkey": _shard_authkey(),
+        "shard_timeout": args.shard_timeout,
+    }
+
+
+def _resolve_codebase(args: argparse.Namespace) -> Path:
+    """Return the local codebase directory, cloning the remote repository if requested."""
+    if args.path is not None:
+        if not args.path.is_dir():
+            raise ValueError(f"Codebase directory does not exist: {args.path}")
+        return args.path
+
+    from utils.tools import Helper
+
+    return Helper.clone_repository(args.repo, args.clone_dir)
+
+
+def _traces_dir(args: argparse.Namespace, codebase_local_dir_path: Path) -> Path:
+    """Return a timestamped traces directory for the current run."""
+    return args.traces_dir / f"{codebase_local_dir_path.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+
+def _extract(codebase_local_dir_path: Path, traces_local_dir_path: Path, args: argparse.Namespace):
+    """Run the extracting stage, which only needs the standard library."""
+    if args.shards > 0:
+        from utils.sharding import extract_sharded
+
+        codebase_analyzer = extract_sharded(codebase_local_dir_path, **_sharding_options(args))
+    else:
+        from utils.codebase_analyzer import CodebaseAnalyzer
+
+        codebase_analyzer = CodebaseAnalyzer()
+        codebase_analyzer.analyze_directory(codebase_local_dir_path)
+    codebase_analyzer.write_trees_to_files(traces_local_dir_path / "extracting_output")
+
+    print(
+        f"Extracted {len(codebase_analyzer.classes)} classes "
+        f"from {len(codebase_analyzer.file_trees)} files"
+    )
+    return codebase_analyzer
+
+
+def _graph(codebase_local_dir_path: Path, traces_local_dir_path: Path, args: argparse.Namespace):
+    """Run the extracting stage, build the methods graph and find invocation paths."""
+    codebase_analyzer = _extract(codebase_local_dir_path, traces_local_dir_path, args)
+
+    from utils.graph_builder import GraphBuilder
+    from utils.invocation_paths import InvocationPathFinder
+    from utils.tools import Helper
+
+    graph_builder = GraphBuilder()
+    graph_builder.build_methods_graph(codebase_analyzer.file_trees, codebase_analyzer.classes)
+    graph_builder.write_graph_to_file(traces_local_dir_path / "extracting_output")
+    graph_builder.write_snapshot_to_file(
+        traces_local_dir_path / "extracting_output",
+        codebase_analyzer.classes,
+        {"codebase_dir": str(codebase_local_dir_path)},
+    )
+
+    invocation_paths = InvocationPathFinder(graph_builder.graph).find_paths()
+    Helper.write_to_file(
+        traces_local_dir_path / "extracting_output" / "invocation_paths.txt",
+        InvocationPathFinder.serialize_paths_to_string(graph_builder.graph, invocation_paths)
+    )
+
+    print(
+        f"Built methods graph with {graph_builder.graph.number_of_nodes()} nodes, "
+        f"{graph_builder.graph.number_of_edges()} edges and {len(invocation_paths)} invocation paths"
+    )
+    return codebase_analyzer, graph_builder, invocation_paths
+
+
+def _analyze(codebase_local_dir_path: Path, traces_local_dir_path: Path, args: argparse.Namespace) -> None:
+    """Run the extracting stage, build the methods graph and analyze it with LLM."""
+    codebase_analyzer, graph_builder, invocation_paths = _graph(codebase_local_dir_path, traces_local_dir_path, args)
+
+    from nodes.analyzing import AnalyzeNode
+    from utils.clients import OpenAIClient
+
+    AnalyzeNode(OpenAIClient.get_tier("fast"))({
+        "codebase_local_dir_path": codebase_local_dir_path,
+        "traces_local_dir_path": traces_local_dir_path,
+        "methods_graph": graph_builder.graph,
+        "classes_info": codebase_analyzer.classes,
+        "invocation_paths": invocation_paths,
+    })
+
+    print(f"LLM analysis written to {traces_local_dir_path / 'llm_analyze.txt'}")
+
+
+def _report(analysis_file_path: Path, report_local_file_path: Path, snapshot_file_path: Path) -> None:
+    """Build the report from a previously saved LLM analysis and graph snapshot."""
+    if not snapshot_file_path.is_file():
+        raise ValueError(f"Graph snapshot does not exist: {snapshot_file_path}, pass it with --snapshot")
+
+    from langchain_core.messages.ai import AIMessage
+    from nodes.reporting import ReportNode
+    from prompts.templates import CLASS_DESCRIPTIONS_MARKER
+    from utils.clients import OpenAIClient
+    from utils.graph_snapshot import GraphSnapshot
+    from utils.invocation_paths import InvocationPathFinder
+    from utils.report_renderer import ReportRenderer
+
+    state = {"report_local_file_path": report_local_file_path}
+    # Decoded in full: the report renders every class, and the path finder needs a networkx
+    # graph with the decorators of every method, which are stored in the attribute heap
+    with GraphSnapshot.open(snapshot_file_path) as snapshot:
+        state["methods_graph"] = snapshot.to_digraph()
+        state["classes_info"] = snapshot.to_classes()
+        if snapshot.metadata.get("codebase_dir"):
+            state["codebase_local_dir_path"] = Path(snapshot.metadata["codebase_dir"])
+    state["invocation_paths"] = InvocationPathFinder(state["methods_graph"]).find_paths()
+
+    insights, state["class_descriptions"] = ReportRenderer.parse_class_descriptions(
+        analysis_file_path.read_text(encoding="utf-8"), state["classes_info"], CLASS_DESCRIPTIONS_MARKER
+    )
+    state["llm_analysis_result"] = AIMessage(content=insights)
+
+    ReportNode(OpenAIClient.get_tier("strong"))(state)
+
+    print(f"Report written to {report_local_file_path}")
+
+
+def _run_all(args: argparse.Namespace) -> None:
+    """Run the full DAG flow of the summary generator agent."""
+    from agents.summary_generator import SummaryGeneratorAgent
+
+    if args.stream and args.shards > 0:
+        raise ValueError("--shards cannot be combined with --stream, which parses the codebase package by package")
+
+    agent = SummaryGeneratorAgent(args.clone_dir, args.report_dir, args.traces_dir)
+    codebase_local_dir_path = _resolve_codebase(args)
+    if args.stream:
+        report_local_file_path = agent.analyze(
+            codebase_local_dir_path,
+            args.report_name,
+            streaming=True,
+            min_component_classes=args.min_component_classes,
+            max_queued_components=args.max_queued_components,
+            max_concurrency=args.max_concurrency,
+        )
+    else:
+        report_local_file_path = agent.analyze(
+            codebase_local_dir_path,
+            args.report_name,
+            sharding_options=_sharding_options(args) if args.shards > 0 else None,
+        )
+
+    print(f"Report written to {report_local_file_path}")
+
+
+def _run_interactive() -> None:
+    """Run the agent interactively, prompting for the repository and report name."""
+    from agents.summary_generator import SummaryGeneratorAgent
+
+    SummaryGeneratorAgent().run()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of the command-line interface.
+
+    Args:
+        argv (Optional[List[str]]): Command-line arguments, defaults to sys.argv.
+
+    Returns:
+        int: Process exit code.
+    """
+    args = build_parser().parse_args(argv)
+
+    if args.command is None:
+        _run_interactive()
+        return 0
+
+    start_time = time()
+    try:
+        if args.command == "report":
+            from utils.tools import Helper
+
+            _report(
+                args.analysis,
+                args.report_dir / Helper.ensure_extension(args.report_name, "md"),
+                args.snapshot or args.analysis.parent / "extracting_output" / "methods_graph.snap",
+            )
+        elif args.command == "all":
+            _run_all(args)
+        elif args.command == "worker":
+            from utils.sharding import parse_address, run_worker
+
+            authkey = _shard_authkey()
+            if authkey is None:
+                raise ValueError("SHARD_AUTHKEY must be set to connect to a coordinator")
+            processed = run_worker(parse_address(args.coordinator), authkey)
+            print(f"Processed {processed} shards")
+        else:
+            codebase_local_dir_path = _resolve_codebase(args)
+            traces_local_dir_path = _traces_dir(args, codebase_local_dir_path)
+            stage = {"extract": _extract, "graph": _graph, "analyze": _analyze}[args.command]
+            stage(codebase_local_dir_path, traces_local_dir_path, args)
+    except Exception as e:
+        print(f"Error! {e}")
+        return 1
+
+    print(f"Stage '{args.command}' completed in {time() - start_time:.2f} seconds.")
+    if args.command in ("analyze", "report", "all"):
+        from utils.clients import OpenAIClient
+
+        print(OpenAIClient.usage_to_string())
+    return 0
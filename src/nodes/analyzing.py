@@ -1,30 +1,47 @@
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List
+from langchain_core.messages.ai import AIMessage
 from networkx import DiGraph
-from prompts.templates import extract_insights_prompt
+from prompts.templates import CLASS_DESCRIPTIONS_MARKER, extract_insights_prompt
 from state.code_analysis import CodeAnalysisState
-from utils.clients import OpenAIClient
+from utils.clients import TieredClient
 from utils.codebase_analyzer import CodebaseAnalyzer
 from utils.graph_builder import GraphBuilder
+from utils.invocation_paths import InvocationPathFinder
+from utils.report_renderer import ReportRenderer
 from utils.tools import Helper
 
 
 class AnalyzeNode:
     """A node that analyzes collected classes and methods leveraging LLM."""
 
-    def __init__(self, llm_client: OpenAIClient) -> None:
+    def __init__(self, llm_client: TieredClient) -> None:
         self.llm_client = llm_client
 
-    def _analyze_with_llm(self, digraph: DiGraph, classes: Dict) -> Dict[str, Any]:
-        """Analyze the provided graph and classes using an LLM."""
+    @staticmethod
+    def _has_class_descriptions(classes: Dict) -> Callable[[AIMessage], bool]:
+        """Build a validator checking that the response describes at least one of the classes."""
+        def validator(response: AIMessage) -> bool:
+            if not classes:
+                return True
+            _, descriptions = ReportRenderer.parse_class_descriptions(
+                response.content, classes, CLASS_DESCRIPTIONS_MARKER
+            )
+            return bool(descriptions)
+        return validator
+
+    def _analyze_with_llm(self, digraph: DiGraph, classes: Dict, invocation_paths: List[Dict]) -> Dict[str, Any]:
+        """Analyze the provided graph, classes and invocation paths using an LLM."""
         graph_data = GraphBuilder.serialize_graph_to_string(digraph)
         classes_data = CodebaseAnalyzer.serialize_classes_to_string(classes)
+        paths_data = InvocationPathFinder.serialize_paths_to_string(digraph, invocation_paths)
 
         full_prompt = extract_insights_prompt.format(
             method_graph=graph_data,
-            classes_data=classes_data
+            classes_data=classes_data,
+            invocation_paths=paths_data
         )
 
-        return self.llm_client.invoke(full_prompt)
+        return self.llm_client.invoke(full_prompt, self._has_class_descriptions(classes))
 
     def __call__(self, state: CodeAnalysisState) -> Dict[str, Any]:
         """Execute the analysis node."""
@@ -32,12 +49,31 @@ class AnalyzeNode:
 
         llm_response = self._analyze_with_llm(
             state["methods_graph"],
-            state["classes_info"]
+            state["classes_info"],
+            state.get("invocation_paths", [])
+        )
+
+        # Keep the analysis to insights only, the table is rendered locally into the report
+        insights, class_descriptions = ReportRenderer.parse_class_descriptions(
+            llm_response.content, state["classes_info"], CLASS_DESCRIPTIONS_MARKER
         )
 
+        # The full response keeps the descriptions block, so the report stage can re-read them
         Helper.write_to_file(
             state["traces_local_dir_path"] / "llm_analyze.txt",
             llm_response.content
         )
+        Helper.write_to_file(
+            state["traces_local_dir_path"] / "classes_table.md",
+            ReportRenderer.render_classes_table(
+                state["classes_info"],
+                state["methods_graph"],
+                class_descriptions,
+                state.get("codebase_local_dir_path"),
+            )
+        )
 
-        return {"llm_analysis_result": llm_response}
\ No newline at end of file
+        return {
+            "llm_analysis_result": llm_response.model_copy(update={"content": insights}),
+            "class_descriptions": class_descriptions,
+        }
@@ -1,7 +1,10 @@
-from typing import Dict, Any
+from typing import Any, Dict, Optional
 from state.code_analysis import CodeAnalysisState
 from utils.codebase_analyzer import CodebaseAnalyzer
 from utils.graph_builder import GraphBuilder
+from utils.invocation_paths import InvocationPathFinder
+from utils.sharding import extract_sharded
+from utils.tools import Helper
 
 
 class ExtractNode:
@@ -9,14 +12,25 @@ class ExtractNode:
     A node that extracts classes and methods leveraging Abstract Syntax Tree (AST) parsers.
     """
 
+    def __init__(self, sharding_options: Optional[Dict] = None) -> None:
+        """
+        Args:
+            sharding_options (Optional[Dict]): Arguments of extract_sharded, the codebase
+                is extracted in a single process if not provided.
+        """
+        self.sharding_options = sharding_options
+
     def __call__(self, state: CodeAnalysisState) -> Dict[str, Any]:
         """Execute the extracting node."""
         print("Running extracting node...")
 
         traces_dir_path = state["traces_local_dir_path"] / "extracting_output"
 
-        codebase_analyzer = CodebaseAnalyzer()
-        codebase_analyzer.analyze_directory(state["codebase_local_dir_path"])
+        if self.sharding_options:
+            codebase_analyzer = extract_sharded(state["codebase_local_dir_path"], **self.sharding_options)
+        else:
+            codebase_analyzer = CodebaseAnalyzer()
+            codebase_analyzer.analyze_directory(state["codebase_local_dir_path"])
         codebase_analyzer.write_trees_to_files(traces_dir_path)
 
         graph_builder = GraphBuilder()
@@ -24,8 +38,20 @@ class ExtractNode:
             codebase_analyzer.file_trees, codebase_analyzer.classes
         )
         graph_builder.write_graph_to_file(traces_dir_path)
+        graph_builder.write_snapshot_to_file(
+            traces_dir_path,
+            codebase_analyzer.classes,
+            {"codebase_dir": str(state["codebase_local_dir_path"])}
+        )
+
+        invocation_paths = InvocationPathFinder(graph_builder.graph).find_paths()
+        Helper.write_to_file(
+            traces_dir_path / "invocation_paths.txt",
+            InvocationPathFinder.serialize_paths_to_string(graph_builder.graph, invocation_paths)
+        )
 
         return {
             "methods_graph": graph_builder.graph,
             "classes_info": codebase_analyzer.classes,
+            "invocation_paths": invocation_paths,
         }
\ No newline at end of file
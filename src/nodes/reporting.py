@@ -1,7 +1,16 @@
+import re
+from typing import List, Tuple
 from state.code_analysis import CodeAnalysisState
-from utils.clients import OpenAIClient
+from utils.clients import TieredClient
+from utils.invocation_paths import InvocationPathFinder
+from utils.report_renderer import ReportRenderer
 from utils.tools import Helper
-from prompts.templates import format_markdown_prompt
+from prompts.templates import (
+    CLASSES_TABLE_PLACEHOLDER,
+    CODE_LINKS_PLACEHOLDER,
+    INVOCATION_PATHS_PLACEHOLDER,
+    format_markdown_prompt,
+)
 
 
 class ReportNode:
@@ -9,9 +18,66 @@ class ReportNode:
     A node that builds the report by documenting all extracted business requirements.
     """
 
-    def __init__(self, llm_client: OpenAIClient) -> None:
+    def __init__(self, llm_client: TieredClient) -> None:
         self.llm_client = llm_client
 
+    @staticmethod
+    def _render_sections(state: CodeAnalysisState) -> List[Tuple[str, str, str]]:
+        """Render the report sections known from extracted data as (placeholder, heading, markdown)."""
+        paths_markdown = InvocationPathFinder.render_paths_to_markdown(
+            state["methods_graph"], state["invocation_paths"]
+        )
+        classes_table = ReportRenderer.render_classes_table(
+            state["classes_info"],
+            state["methods_graph"],
+            state.get("class_descriptions"),
+            state.get("codebase_local_dir_path"),
+        )
+        code_links = ReportRenderer.render_code_links(
+            state["classes_info"],
+            state.get("codebase_local_dir_path"),
+            state["report_local_file_path"].parent,
+        )
+
+        return [
+            (INVOCATION_PATHS_PLACEHOLDER, "Method Invocation Paths", paths_markdown),
+            (CLASSES_TABLE_PLACEHOLDER, "Classes and Methods Overview", classes_table),
+            (CODE_LINKS_PLACEHOLDER, "Links to Corresponding Code Files", code_links),
+        ]
+
+    @staticmethod
+    def _insert_sections(report: str, sections: List[Tuple[str, str, str]]) -> str:
+        """
+        Replace the placeholders left by the LLM with locally rendered sections.
+
+        If a placeholder is missing, the section replaces the content under its heading,
+        or is appended when the heading is missing as well.
+        """
+        for placeholder, heading, markdown in sections:
+            markdown = markdown.rstrip()
+
+            # The prompt quotes placeholders in backticks, which the LLM may copy
+            placeholder_pattern = re.compile(rf"`*{re.escape(placeholder)}`*")
+            if placeholder_pattern.search(report):
+                report = placeholder_pattern.sub(lambda _: markdown, report)
+                continue
+
+            heading_match = re.search(
+                rf"^(#+)[ \t]+{re.escape(heading)}[ \t]*$", report, re.MULTILINE | re.IGNORECASE
+            )
+            if heading_match is None:
+                report = f"{report.rstrip()}\n\n## {heading}\n\n{markdown}\n"
+                continue
+
+            # The section ends at the next heading of the same or a higher level, or at a rule
+            level = len(heading_match.group(1))
+            end_match = re.compile(rf"^(#{{1,{level}}}[ \t]|---[ \t]*$)", re.MULTILINE).search(
+                report, heading_match.end()
+            )
+            end = end_match.start() if end_match else len(report)
+            report = f"{report[:heading_match.end()]}\n\n{markdown}\n\n{report[end:]}"
+        return report
+
     def __call__(self, state: CodeAnalysisState) -> None:
         """Execute the reporting node."""
         print("Running reporting node...")
@@ -22,5 +88,5 @@ class ReportNode:
 
         Helper.write_to_file(
             state["report_local_file_path"],
-            self.llm_client.invoke(full_prompt).content,
-        )
\ No newline at end of file
+            self._insert_sections(self.llm_client.invoke(full_prompt).content, self._render_sections(state)),
+        )
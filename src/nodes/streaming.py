@@ -0,0 +1,159 @@
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from langchain_core.messages.ai import AIMessage
+from nodes.analyzing import AnalyzeNode
+from prompts.templates import CLASS_DESCRIPTIONS_MARKER
+from state.code_analysis import CodeAnalysisState
+from utils.clients import TieredClient
+from utils.codebase_analyzer import CodebaseAnalyzer
+from utils.graph_builder import GraphBuilder
+from utils.invocation_paths import InvocationPathFinder
+from utils.pipeline import PackageStreamer
+from utils.report_renderer import ReportRenderer
+from utils.tools import Helper
+
+NO_CLASSES_ANALYSIS = "No classes were found in the codebase, so there is nothing to analyze."
+
+
+class StreamAnalyzeNode:
+    """
+    A node that overlaps extraction with LLM analysis: components are analyzed
+    as soon as their packages are parsed, while the rest of the codebase is still parsed.
+
+    Each component is analyzed with its own methods graph, since later packages are
+    not parsed yet: calls into other components are only listed by name, and methods
+    called from other components may show up as entry points of the component paths.
+    Invocation paths, tables and links of the report use the complete graph.
+    """
+
+    def __init__(
+        self,
+        llm_client: TieredClient,
+        min_component_classes: int = 20,
+        max_queued_components: int = 4,
+        max_concurrency: int = 4,
+    ) -> None:
+        self.analyze_node = AnalyzeNode(llm_client)
+        self.min_component_classes = min_component_classes
+        self.max_queued_components = max_queued_components
+        self.max_concurrency = max_concurrency
+
+    def _analyze_component(self, codebase_analyzer: CodebaseAnalyzer) -> AIMessage:
+        """Analyze a single component using its own methods graph, without cross-component edges."""
+        graph_builder = GraphBuilder()
+        graph_builder.build_methods_graph(codebase_analyzer.file_trees, codebase_analyzer.classes)
+        invocation_paths = InvocationPathFinder(graph_builder.graph).find_paths()
+
+        return self.analyze_node._analyze_with_llm(
+            graph_builder.graph, codebase_analyzer.classes, invocation_paths
+        )
+
+    @staticmethod
+    def _first_failure(analyses: List[Optional[Future]]) -> Optional[BaseException]:
+        """Return the exception of the first finished component analysis, which failed."""
+        for analysis in analyses:
+            if analysis is not None and analysis.done() and not analysis.cancelled():
+                if analysis.exception() is not None:
+                    return analysis.exception()
+        return None
+
+    def __call__(self, state: CodeAnalysisState) -> Dict[str, Any]:
+        """Execute the streaming extracting and analyzing node."""
+        print("Running streaming extracting and analyzing node...")
+
+        codebase_dir_path = state["codebase_local_dir_path"]
+        traces_dir_path = state["traces_local_dir_path"] / "extracting_output"
+
+        components = []
+        analyses: List[Future] = []
+        # Waiting for a free slot stops taking components, which in turn blocks parsing
+        free_slots = threading.BoundedSemaphore(self.max_concurrency)
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            stream = iter(PackageStreamer(
+                codebase_dir_path, self.min_component_classes, self.max_queued_components
+            ))
+            failure = None
+            try:
+                for component in stream:
+                    components.append(component)
+                    component['analyzer'].write_trees_to_files(traces_dir_path)
+                    if not component['analyzer'].classes:
+                        analyses.append(None)
+                        continue
+
+                    free_slots.acquire()
+                    # Stop at the first failed analysis instead of sending every remaining component
+                    failure = self._first_failure(analyses)
+                    if failure is not None:
+                        free_slots.release()
+                        break
+
+                    future = executor.submit(self._analyze_component, component['analyzer'])
+                    future.add_done_callback(lambda _: free_slots.release())
+                    analyses.append(future)
+            finally:
+                # Stops parsing when the loop is left early
+                stream.close()
+
+            if failure is not None:
+                executor.shutdown(cancel_futures=True)
+                raise failure
+
+            # Build the complete graph while the last components are still analyzed
+            codebase_analyzer = PackageStreamer.merge(components)
+            graph_builder = GraphBuilder()
+            graph_builder.build_methods_graph(codebase_analyzer.file_trees, codebase_analyzer.classes)
+            graph_builder.write_graph_to_file(traces_dir_path)
+            graph_builder.write_snapshot_to_file(
+                traces_dir_path, codebase_analyzer.classes, {"codebase_dir": str(codebase_dir_path)}
+            )
+
+            invocation_paths = InvocationPathFinder(graph_builder.graph).find_paths()
+            Helper.write_to_file(
+                traces_dir_path / "invocation_paths.txt",
+                InvocationPathFinder.serialize_paths_to_string(graph_builder.graph, invocation_paths)
+            )
+
+        sections = []
+        class_descriptions = {}
+        for component, analysis in zip(components, analyses):
+            if analysis is None:
+                continue
+            insights, descriptions = ReportRenderer.parse_class_descriptions(
+                analysis.result().content, component['analyzer'].classes, CLASS_DESCRIPTIONS_MARKER
+            )
+            class_descriptions.update(descriptions)
+            packages = ", ".join(
+                os.path.relpath(package, codebase_dir_path) for package in component['packages']
+            )
+            sections.append(f"### Packages: {packages}\n\n{insights}")
+
+        if not sections:
+            sections.append(NO_CLASSES_ANALYSIS)
+        llm_response = AIMessage(content="\n\n".join(sections))
+
+        # Renumbered against all classes, so the report stage can re-read the descriptions
+        descriptions_block = ReportRenderer.serialize_class_descriptions(
+            codebase_analyzer.classes, class_descriptions, CLASS_DESCRIPTIONS_MARKER
+        )
+        Helper.write_to_file(
+            state["traces_local_dir_path"] / "llm_analyze.txt",
+            "\n\n".join(sections + [descriptions_block]) if descriptions_block else llm_response.content
+        )
+        Helper.write_to_file(
+            state["traces_local_dir_path"] / "classes_table.md",
+            ReportRenderer.render_classes_table(
+                codebase_analyzer.classes, graph_builder.graph, class_descriptions, codebase_dir_path
+            )
+        )
+
+        return {
+            "methods_graph": graph_builder.graph,
+            "classes_info": codebase_analyzer.classes,
+            "invocation_paths": invocation_paths,
+            "llm_analysis_result": llm_response,
+            "class_descriptions": class_descriptions,
+        }
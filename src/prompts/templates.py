@@ -5,9 +5,16 @@ Markdown reports using LangChain's PromptTemplate.
 
 from langchain.prompts import PromptTemplate
 
+# Markers the LLM leaves in the report, replaced with locally rendered sections
+INVOCATION_PATHS_PLACEHOLDER = "<!-- invocation-paths -->"
+CLASSES_TABLE_PLACEHOLDER = "<!-- classes-table -->"
+CODE_LINKS_PLACEHOLDER = "<!-- code-links -->"
+
+# Line starting the compact per-class descriptions block in the analysis response
+CLASS_DESCRIPTIONS_MARKER = "CLASS DESCRIPTIONS:"
 
 extract_insights_prompt = PromptTemplate(
-    input_variables=["method_graph", "classes_data"],
+    input_variables=["method_graph", "classes_data", "invocation_paths"],
     template=(
         "You are an expert in business analysis and Python software engineering. "
         "You must extract and summarize all insights about business logic and "
@@ -16,18 +23,18 @@ extract_insights_prompt = PromptTemplate(
         "{classes_data}\n\n"
         "Methods directed graph, which is built using AST trees:\n"
         "{method_graph}\n\n"
+        "Method invocation paths, precomputed from the graph starting at entry points "
+        "(cycles are shown in braces, '...' marks paths cut at the depth limit):\n"
+        "{invocation_paths}\n\n"
         "YOU MUST IDENTIFY:\n"
         "- Key functionalities provided by the codebase\n"
         "- Main business processes implemented in the functions\n"
         "- Dependencies and relationships between functions\n"
         "- Any inferred high-level business requirements\n\n"
-        "YOU MUST CREATE AND APPEND A TABLE USING INPUT INFORMATION SUCH AS:\n"
-        "- Class and method names\n"
-        "- Class and method relationships\n"
-        "- Method arguments\n"
-        "- Any available docstrings and comments\n\n"
-        "FORMAT OF THE TABLE:\n"
-        "| **File Path** | **Class** | **Methods** | **Arguments** | **Returns** | **Dependencies** | **Functionality** | **Business Process** |\n"
+        "DO NOT CREATE TABLES, tables of classes and methods are rendered from the extracted data.\n\n"
+        f"YOU MUST APPEND THE LINE `{CLASS_DESCRIPTIONS_MARKER}` FOLLOWED BY ONE LINE PER CLASS:\n"
+        "<class number from the Classes list> | <functionality, one short sentence> | "
+        "<business process, a few words>\n"
     ),
 )
 
@@ -49,9 +56,14 @@ format_markdown_prompt = PromptTemplate(
         "implementation of each functionality\n"
         "    - Each method must contain a description (if a docstring is available)\n\n"
         "- ## Method Invocation Paths\n"
+        f"    The paths are precomputed. Write only the line `{INVOCATION_PATHS_PLACEHOLDER}` "
+        "under this heading, it will be replaced with the paths.\n\n"
+        "- ## Classes and Methods Overview\n"
+        f"    The table is precomputed. Write only the line `{CLASSES_TABLE_PLACEHOLDER}` "
+        "under this heading, it will be replaced with the table.\n\n"
         "- ## Links to Corresponding Code Files\n"
-        "    Add the following text to the section if actual URLs are not available: "
-        "(Note: Replace `#` with actual file paths or URLs if available.)\n\n"
+        f"    The links are precomputed. Write only the line `{CODE_LINKS_PLACEHOLDER}` "
+        "under this heading, it will be replaced with the links.\n\n"
         "- ## Summary\n"
         "    Any observations in free form about the codebase, design, and functional purposes\n\n"
         "EXAMPLE:\n\n"
@@ -74,16 +86,13 @@ format_markdown_prompt = PromptTemplate(
         "- **Classes**:\n\n"
         "---\n\n"
         "## Method Invocation Paths\n\n"
-        "### 1. ****\n"
-        "- \n"
-        "- \n\n"
-        "### 2. ****\n"
-        "- \n"
-        "- \n\n"
+        f"{INVOCATION_PATHS_PLACEHOLDER}\n\n"
+        "---\n\n"
+        "## Classes and Methods Overview\n\n"
+        f"{CLASSES_TABLE_PLACEHOLDER}\n\n"
         "---\n\n"
-        "## Path to Corresponding Code File\n"
-        "- ****: [/dir/filename.py](#)\n"
-        "- ****: [/dir/filename.py](#)\n\n"
+        "## Links to Corresponding Code Files\n\n"
+        f"{CODE_LINKS_PLACEHOLDER}\n\n"
         "---\n\n"
         "## Conclusion\n"
         "The product is...\n"
@@ -1,8 +1,11 @@
+import sys
+
 from dotenv import load_dotenv
-from agents.summary_generator import SummaryGeneratorAgent
 
 if __name__ == "__main__":
     load_dotenv()
 
-    summary_generator_agent = SummaryGeneratorAgent()
-    summary_generator_agent.run()
\ No newline at end of file
+    # Imported after load_dotenv, so the CLI defaults pick up the .env settings
+    from cli import main
+
+    sys.exit(main())
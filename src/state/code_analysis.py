@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, List
 from pathlib import Path
 from typing_extensions import TypedDict
 from networkx import DiGraph
@@ -16,10 +16,14 @@ class CodeAnalysisState(TypedDict):
         llm_analysis_result (AIMessage): Results from the LLM analysis.
         classes_info (Dict): Information about extracted classes.
         methods_graph (DiGraph): Directed graph of method relationships.
+        invocation_paths (List[Dict]): Method invocation paths precomputed from the graph.
+        class_descriptions (Dict): Per-class functional descriptions from the LLM analysis.
     """
     codebase_local_dir_path: Path
     traces_local_dir_path: Path
     report_local_file_path: Path
     llm_analysis_result: AIMessage
     classes_info: Dict
-    methods_graph: DiGraph
\ No newline at end of file
+    methods_graph: DiGraph
+    invocation_paths: List[Dict]
+    class_descriptions: Dict
\ No newline at end of file
@@ -1,22 +1,151 @@
 import os
+import threading
+from time import time
+from typing import Callable, Dict, Optional
+from langchain_core.messages.ai import AIMessage
+from langchain_core.rate_limiters import InMemoryRateLimiter
 from langchain_openai import ChatOpenAI
 
+# Tiers from the cheapest to the strongest, a tier escalates to the next one
+TIERS = ("fast", "strong")
+
+
+class TieredClient:
+    """
+    A client for a single model tier with its own concurrency and rate limits,
+    which escalates to a stronger tier when the response fails validation.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        llm: ChatOpenAI,
+        max_concurrency: int = 4,
+        escalate_to: Optional["TieredClient"] = None,
+    ) -> None:
+        """
+        Args:
+            name (str): Name of the tier.
+            llm (ChatOpenAI): Chat model of the tier.
+            max_concurrency (int): Maximum number of concurrent requests.
+            escalate_to (Optional[TieredClient]): Tier to retry with when validation fails.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"Maximum concurrency of the {name} tier must be at least 1, got {max_concurrency}")
+
+        self.name = name
+        self.llm = llm
+        self.escalate_to = escalate_to
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self.usage = {
+            'requests': 0,
+            'escalations': 0,
+            'latency_seconds': 0.0,
+            'input_tokens': 0,
+            'output_tokens': 0,
+        }
+
+    @classmethod
+    def from_env(cls, name: str, escalate_to: Optional["TieredClient"] = None) -> "TieredClient":
+        """
+        Create a tier from ``<TIER>_*`` environment variables, falling back to the
+        default settings (MODEL_NAME, API_KEY, BASE_URL, TEMPERATURE).
+        """
+        prefix = f"{name.upper()}_"
+
+        def setting(key: str, default=None):
+            return os.getenv(prefix + key, os.getenv(key, default))
+
+        requests_per_minute = setting("REQUESTS_PER_MINUTE")
+        rate_limiter = None
+        if requests_per_minute:
+            if float(requests_per_minute) < 1:
+                raise ValueError(f"Requests per minute of the {name} tier must be at least 1, got {requests_per_minute}")
+            rate_limiter = InMemoryRateLimiter(requests_per_second=float(requests_per_minute) / 60)
+
+        llm = ChatOpenAI(
+            model=setting("MODEL_NAME"),
+            api_key=setting("API_KEY"),
+            base_url=setting("BASE_URL"),
+            temperature=float(setting("TEMPERATURE", 0.3)),
+            rate_limiter=rate_limiter,
+        )
+        return cls(name, llm, int(setting("MAX_CONCURRENCY", 4)), escalate_to)
+
+    def _record(self, response: AIMessage, latency: float, escalated: bool) -> None:
+        """Record latency and token usage of a request."""
+        usage_metadata = getattr(response, "usage_metadata", None) or {}
+        with self._lock:
+            self.usage['requests'] += 1
+            self.usage['escalations'] += int(escalated)
+            self.usage['latency_seconds'] += latency
+            self.usage['input_tokens'] += usage_metadata.get('input_tokens', 0)
+            self.usage['output_tokens'] += usage_metadata.get('output_tokens', 0)
+
+    def invoke(self, prompt: str, validator: Optional[Callable[[AIMessage], bool]] = None) -> AIMessage:
+        """
+        Invoke the tier model, escalating to the next tier if the response is not valid.
+
+        Args:
+            prompt (str): The prompt.
+            validator (Optional[Callable[[AIMessage], bool]]): Check of the response.
+
+        Returns:
+            AIMessage: Response of the first tier, which passed validation, or of the last tier.
+        """
+        with self._slots:
+            start_time = time()
+            response = self.llm.invoke(prompt)
+            latency = time() - start_time
+
+        escalated = bool(validator and self.escalate_to and not validator(response))
+        self._record(response, latency, escalated)
+
+        if escalated:
+            return self.escalate_to.invoke(prompt, validator)
+        return response
+
+    def usage_to_string(self) -> str:
+        """Serialize usage statistics of the tier into a string."""
+        usage = self.usage
+        return (
+            f"{self.name} ({self.llm.model_name}): {usage['requests']} requests, "
+            f"{usage['escalations']} escalations, {usage['latency_seconds']:.2f} s, "
+            f"{usage['input_tokens']} input / {usage['output_tokens']} output tokens"
+        )
+
 
 class OpenAIClient:
     """
-    A singleton client for interacting with OpenAI's Chat API.
+    Singleton clients of the model tiers for interacting with OpenAI's Chat API.
     """
 
-    _instance = None
+    _tiers: Dict[str, TieredClient] = {}
 
     @classmethod
-    def get_instance(cls) -> ChatOpenAI:
-        """Get or create a singleton instance of the OpenAI client."""
-        if cls._instance is None:
-            cls._instance = ChatOpenAI(
-                model=os.getenv("MODEL_NAME"),
-                api_key=os.getenv("API_KEY"),
-                base_url=os.getenv("BASE_URL"),
-                temperature=float(os.getenv("TEMPERATURE", 0.3)),
-            )
-        return cls._instance
\ No newline at end of file
+    def get_tier(cls, name: str) -> TieredClient:
+        """Get or create a singleton client of the given model tier."""
+        if name not in TIERS:
+            raise ValueError(f"Unknown model tier: {name}")
+
+        if name not in cls._tiers:
+            # Create stronger tiers first, so every tier can escalate to the next one
+            escalate_to = None
+            for tier_name in reversed(TIERS[TIERS.index(name):]):
+                if tier_name not in cls._tiers:
+                    cls._tiers[tier_name] = TieredClient.from_env(tier_name, escalate_to)
+                escalate_to = cls._tiers[tier_name]
+        return cls._tiers[name]
+
+    @classmethod
+    def usage_to_string(cls) -> str:
+        """Serialize usage statistics of the created model tiers into a string."""
+        if not cls._tiers:
+            return "Model usage: None"
+
+        lines = ["Model usage:"]
+        for name in TIERS:
+            if name in cls._tiers:
+                lines.append(f"- {cls._tiers[name].usage_to_string()}")
+        return "\n".join(lines)
@@ -68,12 +68,20 @@ class CodebaseAnalyzer:
             except Exception:
                 return_type = None  # Fallback if unparse fails
 
+        decorators = []
+        for decorator in node.decorator_list:
+            try:
+                decorators.append(ast.unparse(decorator))
+            except Exception:
+                pass  # Skip decorators which cannot be unparsed
+
         return {
             'name': node.name,
             'line': node.lineno,
             'args': args,
             'return_type': return_type,
             'docstring': ast.get_docstring(node),
+            'decorators': decorators,
             'calls': self._extract_method_calls(node)
         }
 
@@ -88,12 +96,20 @@ class CodebaseAnalyzer:
                     calls.append(child.func.attr)
         return calls
 
+    @staticmethod
+    def collect_python_files(directory: str) -> List[str]:
+        """Collect paths of all Python files in a directory, in the order they are analyzed."""
+        return [
+            os.path.join(root, file)
+            for root, _, files in os.walk(directory)
+            for file in files
+            if file.endswith('.py')
+        ]
+
     def analyze_directory(self, directory: str) -> Dict[str, ast.AST]:
         """Scan a directory and analyze all Python files."""
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if file.endswith('.py'):
-                    self.analyze_file(os.path.join(root, file))
+        for file_path in self.collect_python_files(directory):
+            self.analyze_file(file_path)
         return self.file_trees
 
     def write_trees_to_files(self, output_dir: Path) -> None:
@@ -152,9 +168,9 @@ class CodebaseAnalyzer:
             return "Classes: None"
 
         lines = ["Classes:"]
-        for class_key, class_info in classes.items():
+        for index, (class_key, class_info) in enumerate(classes.items(), start=1):
             class_str = (
-                f"- {class_key} (name: {class_info['name']}, file: {class_info['file']}, "
+                f"- [{index}] {class_key} (name: {class_info['name']}, file: {class_info['file']}, "
                 f"line: {class_info['line']})"
             )
             lines.append(class_str)
@@ -1,8 +1,9 @@
 import ast
 import logging
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 from networkx import DiGraph
+from .graph_snapshot import GraphSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +51,7 @@ class GraphBuilder:
                                 ],
                                 return_type=method.get('return_type', 'None'),
                                 docstring=method.get('docstring', ''),
+                                decorators=method.get('decorators', []),
                                 calls=method.get('calls', []),
                             )
 
@@ -120,6 +122,22 @@ class GraphBuilder:
             output_file.write("}\n")
         logger.info(f"Method graph written to {output_file}")
 
+    def write_snapshot_to_file(self, output_dir: Path, class_info: Dict[str, Dict], metadata: Optional[Dict] = None) -> Path:
+        """
+        Writes the method graph and class info to a binary, memory-mappable snapshot.
+
+        Args:
+            output_dir (Path): Directory where the snapshot file will be saved.
+            class_info (Dict[str, Dict]): Information about classes and methods.
+            metadata (Optional[Dict]): Additional data stored with the snapshot.
+
+        Returns:
+            Path: Path to the snapshot file.
+        """
+        output_file = GraphSnapshot.write(output_dir / "methods_graph.snap", self.graph, class_info, metadata)
+        logger.info(f"Method graph snapshot written to {output_file}")
+        return output_file
+
     @staticmethod
     def serialize_graph_to_string(graph: DiGraph) -> str:
         """
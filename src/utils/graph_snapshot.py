@@ -0,0 +1,354 @@
+"""
+Binary, memory-mappable snapshot of the methods graph and the class index.
+
+Layout (all sections 8-byte aligned, arrays in native byte order)::
+
+    header          magic, version, byte order, counts and section offsets
+    string table    offsets (u64[strings + 1]) and UTF-8 data
+    nodes           sorted by node ID: id, name, class, file string IDs (u32[nodes] each),
+                    attribute heap offsets (u64[nodes]) and lengths (u32[nodes])
+    edges           CSR: per node offsets (u64[nodes + 1]), targets (u32[edges]),
+                    edge type string IDs (u32[edges])
+    classes         sorted by class key: key string IDs (u32[classes]),
+                    heap offsets (u64[classes]) and lengths (u32[classes])
+    heap            JSON-encoded node attributes, class info and metadata
+
+Opening a snapshot maps the file read-only, so processes opening the same file
+share its pages. Attributes and class info are decoded lazily on access.
+"""
+
+import bisect
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from networkx import DiGraph
+
+MAGIC = b"CAGSNAP\0"
+VERSION = 1
+
+SECTIONS = (
+    "string_offsets", "string_data",
+    "node_ids", "node_names", "node_classes", "node_files", "node_attr_offsets", "node_attr_lengths",
+    "edge_offsets", "edge_targets", "edge_types",
+    "class_keys", "class_offsets", "class_lengths",
+    "heap",
+)
+
+# magic, version, byte order, strings, nodes, edges, classes, metadata offset and length, sections
+HEADER = struct.Struct(f"<8sII4QQQ{len(SECTIONS)}Q")
+BYTE_ORDERS = {"little": 1, "big": 2}
+
+# Array type codes of 32-bit and 64-bit unsigned integers
+U32 = "I" if array("I").itemsize == 4 else "L"
+U64 = "Q"
+U64_SECTIONS = {"string_offsets", "node_attr_offsets", "edge_offsets", "class_offsets"}
+
+
+def _align(offset: int) -> int:
+    """Round an offset up to a multiple of 8."""
+    return (offset + 7) & ~7
+
+
+class _StringColumn:
+    """A lazy sequence of strings referenced by string IDs, usable with bisect."""
+
+    def __init__(self, snapshot: "GraphSnapshot", string_ids: memoryview) -> None:
+        self.snapshot = snapshot
+        self.string_ids = string_ids
+
+    def __len__(self) -> int:
+        return len(self.string_ids)
+
+    def __getitem__(self, index: int) -> str:
+        return self.snapshot.string(self.string_ids[index])
+
+
+class GraphSnapshot:
+    """A read-only, memory-mapped snapshot of the methods graph and class index."""
+
+    def __init__(self, path: Path) -> None:
+        """
+        Open a snapshot file.
+
+        Args:
+            path (Path): Path to the snapshot file.
+        """
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Empty snapshot file: {self.path}")
+        self._buffer = memoryview(self._mmap)
+
+        if len(self._buffer) < HEADER.size:
+            self.close()
+            raise ValueError(f"Invalid snapshot file: {self.path}")
+
+        magic, version, byte_order, *fields = HEADER.unpack_from(self._buffer)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Invalid snapshot file or version: {self.path}")
+        if byte_order != BYTE_ORDERS[sys.byteorder]:
+            self.close()
+            raise ValueError(f"Snapshot was written on a machine with another byte order: {self.path}")
+
+        self.num_strings, self.num_nodes, self.num_edges, self.num_classes = fields[:4]
+        self._metadata_offset, self._metadata_length = fields[4:6]
+        offsets = dict(zip(SECTIONS, fields[6:]))
+
+        def section(name: str, type_code: str, length: int) -> memoryview:
+            itemsize = 8 if type_code == U64 else 4
+            start = offsets[name]
+            end = start + length * itemsize
+            if end > len(self._buffer):
+                raise ValueError(f"Invalid snapshot file: {self.path}, section {name} exceeds the file")
+            return self._buffer[start:end].cast(type_code)
+
+        try:
+            self._string_offsets = section("string_offsets", U64, self.num_strings + 1)
+            self._string_data = offsets["string_data"]
+            self._heap = offsets["heap"]
+
+            self._node_ids = section("node_ids", U32, self.num_nodes)
+            self._node_names = section("node_names", U32, self.num_nodes)
+            self._node_classes = section("node_classes", U32, self.num_nodes)
+            self._node_files = section("node_files", U32, self.num_nodes)
+            self._node_attr_offsets = section("node_attr_offsets", U64, self.num_nodes)
+            self._node_attr_lengths = section("node_attr_lengths", U32, self.num_nodes)
+
+            self._edge_offsets = section("edge_offsets", U64, self.num_nodes + 1)
+            self._edge_targets = section("edge_targets", U32, self.num_edges)
+            self._edge_types = section("edge_types", U32, self.num_edges)
+
+            self._class_keys = section("class_keys", U32, self.num_classes)
+            self._class_offsets = section("class_offsets", U64, self.num_classes)
+            self._class_lengths = section("class_lengths", U32, self.num_classes)
+
+            # Variable-length sections: the last string offset ends the string data,
+            # metadata is stored last in the heap
+            if self._string_data + self._string_offsets[self.num_strings] > len(self._buffer):
+                raise ValueError(f"Invalid snapshot file: {self.path}, section string_data exceeds the file")
+            if self._heap + self._metadata_offset + self._metadata_length > len(self._buffer):
+                raise ValueError(f"Invalid snapshot file: {self.path}, section heap exceeds the file")
+        except ValueError:
+            self.close()
+            raise
+
+        self._node_id_column = _StringColumn(self, self._node_ids)
+        self._class_key_column = _StringColumn(self, self._class_keys)
+
+    @classmethod
+    def open(cls, path: Path) -> "GraphSnapshot":
+        """Open a snapshot file."""
+        return cls(path)
+
+    def close(self) -> None:
+        """Release the memory map and the file."""
+        for name in (
+            "_string_offsets", "_node_ids", "_node_names", "_node_classes", "_node_files",
+            "_node_attr_offsets", "_node_attr_lengths", "_edge_offsets", "_edge_targets",
+            "_edge_types", "_class_keys", "_class_offsets", "_class_lengths", "_buffer",
+        ):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        self.__dict__.pop("_node_id_column", None)
+        self.__dict__.pop("_class_key_column", None)
+        if getattr(self, "_mmap", None) is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self) -> "GraphSnapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def string(self, string_id: int) -> str:
+        """Decode a string of the string table."""
+        start = self._string_data + self._string_offsets[string_id]
+        end = self._string_data + self._string_offsets[string_id + 1]
+        return str(self._buffer[start:end], "utf-8")
+
+    def _decode_heap(self, offset: int, length: int):
+        """Decode a JSON value from the attribute heap."""
+        start = self._heap + offset
+        return json.loads(self._buffer[start:start + length].tobytes())
+
+    @property
+    def metadata(self) -> Dict:
+        """Metadata stored with the snapshot, e.g. the codebase directory."""
+        return self._decode_heap(self._metadata_offset, self._metadata_length)
+
+    def node_index(self, node_id: str) -> int:
+        """Find the integer ID of a node by its string ID, raising KeyError if it is missing."""
+        index = bisect.bisect_left(self._node_id_column, node_id)
+        if index == self.num_nodes or self._node_id_column[index] != node_id:
+            raise KeyError(node_id)
+        return index
+
+    def node_id(self, index: int) -> str:
+        """Return the string ID of a node."""
+        return self.string(self._node_ids[index])
+
+    def node_name(self, index: int) -> str:
+        """Return the method name of a node without decoding its attributes."""
+        return self.string(self._node_names[index])
+
+    def node_class(self, index: int) -> str:
+        """Return the class name of a node without decoding its attributes."""
+        return self.string(self._node_classes[index])
+
+    def node_file(self, index: int) -> str:
+        """Return the file of a node without decoding its attributes."""
+        return self.string(self._node_files[index])
+
+    def node_attrs(self, index: int) -> Dict:
+        """Decode all attributes of a node."""
+        return self._decode_heap(self._node_attr_offsets[index], self._node_attr_lengths[index])
+
+    def successors(self, index: int) -> List[int]:
+        """Return the integer IDs of the nodes a node has edges to."""
+        return self._edge_targets[self._edge_offsets[index]:self._edge_offsets[index + 1]].tolist()
+
+    def out_edges(self, index: int) -> Iterator[Tuple[int, str]]:
+        """Iterate over (target, edge type) of the outgoing edges of a node."""
+        for position in range(self._edge_offsets[index], self._edge_offsets[index + 1]):
+            yield self._edge_targets[position], self.string(self._edge_types[position])
+
+    def class_keys(self) -> List[str]:
+        """Return the sorted keys of the class index."""
+        return [self._class_key_column[index] for index in range(self.num_classes)]
+
+    def class_info(self, class_key: str) -> Dict:
+        """Decode the info of a class, raising KeyError if it is missing."""
+        index = bisect.bisect_left(self._class_key_column, class_key)
+        if index == self.num_classes or self._class_key_column[index] != class_key:
+            raise KeyError(class_key)
+        return self._decode_heap(self._class_offsets[index], self._class_lengths[index])
+
+    def to_classes(self) -> Dict:
+        """Decode the whole class index, in the order it was written."""
+        # Class keys are sorted for lookups, the original order is kept in the heap order
+        indexes = sorted(range(self.num_classes), key=lambda index: self._class_offsets[index])
+        return {
+            self._class_key_column[index]: self._decode_heap(self._class_offsets[index], self._class_lengths[index])
+            for index in indexes
+        }
+
+    def to_digraph(self) -> DiGraph:
+        """Decode the whole snapshot into a DiGraph."""
+        graph = DiGraph()
+        for index in range(self.num_nodes):
+            graph.add_node(self.node_id(index), **self.node_attrs(index))
+        for index in range(self.num_nodes):
+            source = self.node_id(index)
+            for target, edge_type in self.out_edges(index):
+                graph.add_edge(source, self.node_id(target), type=edge_type)
+        return graph
+
+    @staticmethod
+    def write(path: Path, graph: DiGraph, classes: Dict, metadata: Optional[Dict] = None) -> Path:
+        """
+        Write the methods graph and the class index to a snapshot file.
+
+        Args:
+            path (Path): Path to the snapshot file.
+            graph (DiGraph): The methods graph.
+            classes (Dict): Information about extracted classes.
+            metadata (Optional[Dict]): Additional JSON-serializable data.
+
+        Returns:
+            Path: Path to the snapshot file.
+        """
+        strings: Dict[str, int] = {}
+
+        def intern(value) -> int:
+            value = "" if value is None else str(value)
+            if value not in strings:
+                strings[value] = len(strings)
+            return strings[value]
+
+        heap = bytearray()
+
+        def store(value) -> Tuple[int, int]:
+            data = json.dumps(value, default=str, separators=(",", ":")).encode("utf-8")
+            offset = len(heap)
+            heap.extend(data)
+            return offset, len(data)
+
+        node_ids = sorted(graph.nodes, key=str)
+        node_index = {node: index for index, node in enumerate(node_ids)}
+
+        columns = {
+            name: array(U64 if name in U64_SECTIONS else U32)
+            for name in SECTIONS if name not in ("string_data", "heap")
+        }
+
+        for node in node_ids:
+            attrs = graph.nodes[node]
+            columns["node_ids"].append(intern(node))
+            columns["node_names"].append(intern(attrs.get('name')))
+            columns["node_classes"].append(intern(attrs.get('class_name')))
+            columns["node_files"].append(intern(attrs.get('file')))
+            offset, length = store(dict(attrs))
+            columns["node_attr_offsets"].append(offset)
+            columns["node_attr_lengths"].append(length)
+
+        columns["edge_offsets"].append(0)
+        for node in node_ids:
+            for _, target, data in graph.out_edges(node, data=True):
+                columns["edge_targets"].append(node_index[target])
+                columns["edge_types"].append(intern(data.get('type')))
+            columns["edge_offsets"].append(len(columns["edge_targets"]))
+
+        # The class index is sorted by key for lookups, heap offsets keep the original order
+        class_entries = [(str(class_key), store(classes[class_key])) for class_key in classes]
+        for class_key, (offset, length) in sorted(class_entries):
+            columns["class_keys"].append(intern(class_key))
+            columns["class_offsets"].append(offset)
+            columns["class_lengths"].append(length)
+
+        metadata_offset, metadata_length = store(metadata or {})
+
+        string_data = bytearray()
+        columns["string_offsets"].append(0)
+        for value in strings:
+            string_data.extend(value.encode("utf-8"))
+            columns["string_offsets"].append(len(string_data))
+
+        blobs = {name: column.tobytes() for name, column in columns.items()}
+        blobs["string_data"] = bytes(string_data)
+        blobs["heap"] = bytes(heap)
+
+        offsets = []
+        position = _align(HEADER.size)
+        for name in SECTIONS:
+            offsets.append(position)
+            position = _align(position + len(blobs[name]))
+
+        header = HEADER.pack(
+            MAGIC, VERSION, BYTE_ORDERS[sys.byteorder],
+            len(strings), len(node_ids), len(columns["edge_targets"]), len(columns["class_keys"]),
+            metadata_offset, metadata_length, *offsets,
+        )
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as output_file:
+            output_file.write(header)
+            for name, offset in zip(SECTIONS, offsets):
+                output_file.write(b"\0" * (offset - output_file.tell()))
+                output_file.write(blobs[name])
+        # Replace atomically, so readers never see a partially written snapshot
+        os.replace(tmp_path, path)
+        return path
@@ -0,0 +1,219 @@
+import logging
+from typing import Dict, List, Tuple
+from networkx import DiGraph, condensation
+
+logger = logging.getLogger(__name__)
+
+# Method names treated as entry points regardless of incoming calls
+ENTRY_POINT_NAMES = {"main"}
+
+# Method names used by frameworks to dispatch work into user code
+HANDLER_METHOD_NAMES = {"__call__", "handle", "dispatch"}
+
+# Decorator names (last dotted segment) registering framework handlers on any receiver
+HANDLER_DECORATOR_NAMES = {"route", "websocket", "shared_task", "api_view", "receiver", "on_event"}
+
+# Generic decorator names, which register handlers only on a framework-looking receiver,
+# e.g. ``@app.get`` or ``@router.post``, but not ``@patch`` or ``@mock.patch``
+ROUTED_DECORATOR_NAMES = {"get", "post", "put", "patch", "delete", "task", "command"}
+HANDLER_RECEIVER_NAMES = {"app", "router", "bp", "blueprint", "api", "celery", "cli", "click", "typer"}
+
+
+class InvocationPathFinder:
+    """Enumerates method invocation paths over the methods graph built by GraphBuilder."""
+
+    def __init__(self, graph: DiGraph, max_depth: int = 8, max_paths: int = 100, max_paths_per_entry: int = 10):
+        """
+        Args:
+            graph (DiGraph): The methods graph.
+            max_depth (int): Maximum number of steps in a path.
+            max_paths (int): Maximum number of paths to enumerate in total.
+            max_paths_per_entry (int): Maximum number of paths to enumerate from a single entry point.
+        """
+        self.graph = graph
+        self.max_depth = max_depth
+        self.max_paths = max_paths
+        self.max_paths_per_entry = max_paths_per_entry
+
+        # Only call edges represent invocations, "overrides" edges are dropped
+        self.call_graph = DiGraph()
+        self.call_graph.add_nodes_from(graph.nodes)
+        self.call_graph.add_edges_from(
+            (u, v) for u, v, data in graph.edges(data=True) if data.get('type') == 'call'
+        )
+
+        # Condensation collapses recursive cycles (SCCs) into single nodes of a DAG
+        self.dag = condensation(self.call_graph)
+        self._members = {
+            scc: sorted(self.dag.nodes[scc]['members']) for scc in self.dag.nodes
+        }
+        self._memo: Dict[Tuple[int, int], List[Tuple[Tuple[int, ...], bool]]] = {}
+
+    @staticmethod
+    def is_handler(attrs: Dict) -> bool:
+        """Check whether a method node looks like a framework handler."""
+        if attrs.get('name') in HANDLER_METHOD_NAMES:
+            return True
+        for decorator in attrs.get('decorators', []):
+            parts = decorator.split("(", 1)[0].split(".")
+            if parts[-1] in HANDLER_DECORATOR_NAMES:
+                return True
+            if parts[-1] in ROUTED_DECORATOR_NAMES and len(parts) > 1 and parts[-2] in HANDLER_RECEIVER_NAMES:
+                return True
+        return False
+
+    def find_entry_points(self) -> List[str]:
+        """
+        Detect entry point methods.
+
+        A method is an entry point if it is named ``main``, if it looks like a framework
+        handler, or if nothing calls it. For recursive cycles nobody else calls into,
+        the first member of the cycle is used. Methods, which call nothing, are dropped,
+        since a single-method path tells nothing about the flow.
+
+        Returns:
+            List[str]: Node IDs of the entry points, ``main`` first, then handlers,
+            then uncalled methods, each group sorted.
+        """
+        mains, handlers = set(), set()
+        for node, attrs in self.graph.nodes(data=True):
+            if attrs.get('name') in ENTRY_POINT_NAMES:
+                mains.add(node)
+            elif self.is_handler(attrs):
+                handlers.add(node)
+
+        uncalled = set()
+        for scc in self.dag.nodes:
+            if self.dag.in_degree(scc) == 0:
+                uncalled.add(self._members[scc][0])
+
+        return [
+            node
+            for group in (sorted(mains), sorted(handlers), sorted(uncalled - mains - handlers))
+            for node in group
+            if self.call_graph.out_degree(node) > 0
+        ]
+
+    def _chains_from(self, scc: int, depth: int) -> List[Tuple[Tuple[int, ...], bool]]:
+        """
+        Enumerate chains of SCCs starting at the given SCC, memoized by (scc, depth).
+
+        Returns:
+            List[Tuple[Tuple[int, ...], bool]]: Chains and whether each was cut by the depth limit.
+        """
+        key = (scc, depth)
+        if key in self._memo:
+            return self._memo[key]
+
+        successors = sorted(self.dag.successors(scc), key=lambda s: self._members[s][0])
+        if not successors:
+            chains = [((scc,), False)]
+        elif depth <= 1:
+            chains = [((scc,), True)]
+        else:
+            chains = []
+            for successor in successors:
+                for tail, truncated in self._chains_from(successor, depth - 1):
+                    chains.append(((scc,) + tail, truncated))
+                    if len(chains) >= self.max_paths_per_entry:
+                        break
+                if len(chains) >= self.max_paths_per_entry:
+                    break
+
+        self._memo[key] = chains
+        return chains
+
+    def find_paths(self) -> List[Dict]:
+        """
+        Enumerate bounded-depth invocation paths starting at every entry point,
+        at most max_paths_per_entry per entry point and max_paths in total.
+
+        Returns:
+            List[Dict]: Paths with the entry point, the steps (each step lists the
+            methods of one recursive cycle, or a single method) and a truncation flag.
+        """
+        scc_of = self.dag.graph['mapping']
+        paths = []
+
+        for entry_point in self.find_entry_points():
+            entry_scc = scc_of[entry_point]
+            for chain, truncated in self._chains_from(entry_scc, self.max_depth):
+                steps = [self._members[scc] for scc in chain]
+                # Start the path from the entry point itself, even inside a cycle
+                steps[0] = [entry_point] + [m for m in steps[0] if m != entry_point]
+                paths.append({
+                    'entry': entry_point,
+                    'steps': steps,
+                    'truncated': truncated,
+                })
+                if len(paths) >= self.max_paths:
+                    logger.info(f"Invocation paths limited to {self.max_paths}")
+                    return paths
+
+        return paths
+
+    @staticmethod
+    def _method_label(graph: DiGraph, node: str) -> str:
+        """Return a short ``Class.method`` label for a node."""
+        attrs = graph.nodes[node]
+        if 'class_name' in attrs and 'name' in attrs:
+            return f"{attrs['class_name']}.{attrs['name']}"
+        return node
+
+    @staticmethod
+    def _path_to_string(graph: DiGraph, path: Dict, separator: str = " -> ") -> str:
+        """Render a single path as a compact chain of method labels."""
+        steps = []
+        for members in path['steps']:
+            labels = [InvocationPathFinder._method_label(graph, member) for member in members]
+            steps.append(labels[0] if len(labels) == 1 else "{" + " <-> ".join(labels) + "}")
+        if path['truncated']:
+            steps.append("...")
+        return separator.join(steps)
+
+    @staticmethod
+    def serialize_paths_to_string(graph: DiGraph, paths: List[Dict]) -> str:
+        """
+        Serializes invocation paths to a compact string for LLM input.
+
+        Args:
+            graph (DiGraph): The methods graph the paths were found in.
+            paths (List[Dict]): Paths returned by find_paths.
+
+        Returns:
+            str: A string representation of the paths.
+        """
+        if not paths:
+            return "Method Invocation Paths: None"
+
+        lines = ["Method Invocation Paths:"]
+        for path in paths:
+            lines.append(f"- {InvocationPathFinder._path_to_string(graph, path)}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def render_paths_to_markdown(graph: DiGraph, paths: List[Dict]) -> str:
+        """
+        Renders invocation paths as Markdown, grouped by entry point.
+
+        Args:
+            graph (DiGraph): The methods graph the paths were found in.
+            paths (List[Dict]): Paths returned by find_paths.
+
+        Returns:
+            str: Markdown content of the "Method Invocation Paths" section.
+        """
+        if not paths:
+            return "No method invocation paths found."
+
+        paths_by_entry = {}
+        for path in paths:
+            paths_by_entry.setdefault(path['entry'], []).append(path)
+
+        lines = []
+        for index, (entry, entry_paths) in enumerate(paths_by_entry.items(), start=1):
+            lines.append(f"### {index}. **{InvocationPathFinder._method_label(graph, entry)}**")
+            for path in entry_paths:
+                lines.append(f"- {InvocationPathFinder._path_to_string(graph, path, ' → ')}")
+            lines.append("")
+        return "\n".join(lines).rstrip() + "\n"
@@ -0,0 +1,111 @@
+import logging
+import os
+import threading
+from queue import Empty, Full, Queue
+from typing import Dict, Iterator, List
+
+from .codebase_analyzer import CodebaseAnalyzer
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class PackageStreamer:
+    """
+    Parses a codebase package by package in a background thread and streams
+    completed components through a bounded queue.
+
+    A component groups consecutive packages until it holds at least
+    ``min_component_classes`` classes. When ``max_queued_components`` components
+    are waiting, parsing blocks until the consumer takes one (backpressure).
+    """
+
+    def __init__(self, directory: str, min_component_classes: int = 20, max_queued_components: int = 4):
+        """
+        Args:
+            directory (str): Codebase directory to parse.
+            min_component_classes (int): Minimum number of classes in a component.
+            max_queued_components (int): Maximum number of components waiting in the queue.
+        """
+        self.directory = directory
+        self.min_component_classes = min_component_classes
+        self.queue = Queue(maxsize=max_queued_components)
+        self.produced = 0
+        self._stop = threading.Event()
+
+    def _put(self, item) -> bool:
+        """Put an item into the queue, giving up when the consumer stopped."""
+        while not self._stop.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _emit(self, component: Dict) -> bool:
+        """Emit a completed component."""
+        self.produced += 1
+        return self._put(component)
+
+    def _produce(self) -> None:
+        """Parse packages and emit components, finishing with a sentinel."""
+        try:
+            component = {'packages': [], 'analyzer': CodebaseAnalyzer()}
+            for root, _, files in os.walk(self.directory):
+                python_files = sorted(file for file in files if file.endswith('.py'))
+                if not python_files:
+                    continue
+
+                for file in python_files:
+                    component['analyzer'].analyze_file(os.path.join(root, file))
+                component['packages'].append(root)
+
+                if len(component['analyzer'].classes) >= self.min_component_classes:
+                    if not self._emit(component):
+                        return
+                    component = {'packages': [], 'analyzer': CodebaseAnalyzer()}
+
+            if component['packages'] and not self._emit(component):
+                return
+            self._put(_DONE)
+        except Exception as e:
+            self._put(e)
+
+    def __iter__(self) -> Iterator[Dict]:
+        """
+        Yield components as soon as they are parsed.
+
+        Yields:
+            Dict: Component with the parsed package directories ("packages") and
+            a CodebaseAnalyzer holding their classes and AST trees ("analyzer").
+        """
+        producer = threading.Thread(target=self._produce, name="package-streamer", daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = self.queue.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            self._stop.set()
+            # Unblock the producer if it still waits on a full queue
+            try:
+                while True:
+                    self.queue.get_nowait()
+            except Empty:
+                pass
+            producer.join()
+
+    @staticmethod
+    def merge(components: List[Dict]) -> CodebaseAnalyzer:
+        """Merge the analyzers of streamed components into a single CodebaseAnalyzer."""
+        codebase_analyzer = CodebaseAnalyzer()
+        for component in components:
+            codebase_analyzer.file_trees.update(component['analyzer'].file_trees)
+            codebase_analyzer.classes.update(component['analyzer'].classes)
+        return codebase_analyzer
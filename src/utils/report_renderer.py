@@ -0,0 +1,170 @@
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from networkx import DiGraph
+
+logger = logging.getLogger(__name__)
+
+# Matches "<class number> | <functionality> | <business process>" lines, also written as table rows
+DESCRIPTION_LINE_PATTERN = re.compile(r"^\s*[-*]?\s*\|?\s*\[?(\d+)\]?\s*\|([^|]*)\|([^|]*)\|?\s*$")
+
+
+class ReportRenderer:
+    """Renders report sections, which are fully known from extracted data, without LLM."""
+
+    @staticmethod
+    def parse_class_descriptions(text: str, classes: Dict, marker: str) -> Tuple[str, Dict[str, Dict]]:
+        """
+        Parses per-class descriptions the LLM appended after the given marker line.
+
+        Args:
+            text (str): LLM response.
+            classes (Dict): Information about extracted classes, in the order they were numbered.
+            marker (str): Line which starts the descriptions block.
+
+        Returns:
+            Tuple[str, Dict[str, Dict]]: The response without the descriptions block and
+            the descriptions ("functionality", "business_process") by class key.
+        """
+        if marker not in text:
+            return text, {}
+
+        insights, block = text.split(marker, 1)
+        class_keys = list(classes)
+        descriptions = {}
+        for line in block.splitlines():
+            match = DESCRIPTION_LINE_PATTERN.match(line)
+            if not match:
+                continue
+            index = int(match.group(1)) - 1
+            if 0 <= index < len(class_keys):
+                descriptions[class_keys[index]] = {
+                    'functionality': match.group(2).strip(),
+                    'business_process': match.group(3).strip(),
+                }
+        if not descriptions:
+            logger.warning(f"No class descriptions could be parsed after the '{marker}' line")
+        return insights.rstrip(), descriptions
+
+    @staticmethod
+    def serialize_class_descriptions(classes: Dict, descriptions: Dict[str, Dict], marker: str) -> str:
+        """
+        Serializes per-class descriptions into the block parse_class_descriptions reads.
+
+        Args:
+            classes (Dict): Information about extracted classes, in the order they are numbered.
+            descriptions (Dict[str, Dict]): Descriptions by class key.
+            marker (str): Line which starts the descriptions block.
+
+        Returns:
+            str: The descriptions block, or an empty string if there are no descriptions.
+        """
+        lines = [
+            f"{index} | {descriptions[class_key]['functionality']} | {descriptions[class_key]['business_process']}"
+            for index, class_key in enumerate(classes, start=1)
+            if class_key in descriptions
+        ]
+        return "\n".join([marker] + lines) if lines else ""
+
+    @staticmethod
+    def _cell(values: List[str]) -> str:
+        """Format values as a single Markdown table cell."""
+        values = [str(value).replace("|", "\\|").replace("\n", " ") for value in values if value]
+        return "<br>".join(values) if values else "-"
+
+    @staticmethod
+    def _dependencies(class_key: str, class_data: Dict, graph: Optional[DiGraph]) -> List[str]:
+        """Collect base classes and classes whose methods are called by the given class."""
+        dependencies = list(class_data['bases'])
+        if graph is None:
+            return dependencies
+
+        for method in class_data['methods']:
+            method_id = f"{class_key}:{method['name']}"
+            if method_id not in graph:
+                continue
+            for _, target, data in graph.out_edges(method_id, data=True):
+                target_class = graph.nodes[target].get('class_name')
+                if data.get('type') == 'call' and target_class and target_class != class_data['name']:
+                    if target_class not in dependencies:
+                        dependencies.append(target_class)
+        return dependencies
+
+    @staticmethod
+    def render_classes_table(
+        classes: Dict,
+        graph: Optional[DiGraph] = None,
+        descriptions: Optional[Dict[str, Dict]] = None,
+        root_dir: Optional[Path] = None,
+    ) -> str:
+        """
+        Renders the structural table of classes and methods as Markdown.
+
+        Args:
+            classes (Dict): Information about extracted classes.
+            graph (Optional[DiGraph]): The methods graph, used for dependencies.
+            descriptions (Optional[Dict[str, Dict]]): Per-class descriptions from LLM.
+            root_dir (Optional[Path]): Codebase directory file paths are made relative to.
+
+        Returns:
+            str: Markdown table.
+        """
+        if not classes:
+            return "No classes found.\n"
+
+        descriptions = descriptions or {}
+        lines = [
+            "| **File Path** | **Class** | **Methods** | **Arguments** | **Returns** "
+            "| **Dependencies** | **Functionality** | **Business Process** |",
+            "|---|---|---|---|---|---|---|---|",
+        ]
+        for class_key, class_data in classes.items():
+            methods = class_data['methods']
+            description = descriptions.get(class_key, {})
+            row = [
+                ReportRenderer._cell([ReportRenderer._relative_path(class_data['file'], root_dir)]),
+                ReportRenderer._cell([class_data['name']]),
+                ReportRenderer._cell([method['name'] for method in methods]),
+                ReportRenderer._cell([
+                    ", ".join(f"{arg['name']}: {arg['type'] or 'Any'}" for arg in method['args']) or "()"
+                    for method in methods
+                ]),
+                ReportRenderer._cell([method['return_type'] or "None" for method in methods]),
+                ReportRenderer._cell(ReportRenderer._dependencies(class_key, class_data, graph)),
+                ReportRenderer._cell([description.get('functionality')]),
+                ReportRenderer._cell([description.get('business_process')]),
+            ]
+            lines.append("| " + " | ".join(row) + " |")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _relative_path(file_path: str, root_dir: Optional[Path]) -> str:
+        """Return the file path relative to the given directory, using forward slashes."""
+        if root_dir is not None:
+            file_path = os.path.relpath(file_path, root_dir)
+        return Path(file_path).as_posix()
+
+    @staticmethod
+    def render_code_links(classes: Dict, root_dir: Optional[Path] = None, report_dir: Optional[Path] = None) -> str:
+        """
+        Renders links from each class to its code file as Markdown.
+
+        Args:
+            classes (Dict): Information about extracted classes.
+            root_dir (Optional[Path]): Codebase directory file paths are shown relative to.
+            report_dir (Optional[Path]): Directory of the report file links are made relative to.
+
+        Returns:
+            str: Markdown list of links.
+        """
+        if not classes:
+            return "No classes found.\n"
+
+        lines = []
+        for class_data in classes.values():
+            path = ReportRenderer._relative_path(class_data['file'], root_dir)
+            target = ReportRenderer._relative_path(class_data['file'], report_dir)
+            lines.append(f"- **{class_data['name']}**: [{path}]({target}#L{class_data['line']})")
+        return "\n".join(lines) + "\n"
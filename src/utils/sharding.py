@@ -0,0 +1,305 @@
+import heapq
+import logging
+import multiprocessing
+import os
+import secrets
+import threading
+from multiprocessing.connection import Client, Connection, Listener
+from queue import Empty, Queue
+from time import sleep
+from typing import Dict, List, Optional, Tuple
+
+from .codebase_analyzer import CodebaseAnalyzer
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for the result of a shard before handing it out to another worker
+DEFAULT_SHARD_TIMEOUT = 600.0
+
+
+def partition_files(files: List[str], num_shards: int) -> List[List[str]]:
+    """
+    Partitions files into size-balanced shards, assigning the largest files first
+    to the currently smallest shard.
+
+    Args:
+        files (List[str]): Paths of the files.
+        num_shards (int): Number of shards.
+
+    Returns:
+        List[List[str]]: Non-empty shards, files of each shard keep their original order.
+    """
+    order = {file: index for index, file in enumerate(files)}
+    bins = [(0, shard_id) for shard_id in range(max(1, num_shards))]
+    shards = [[] for _ in bins]
+
+    for file in sorted(files, key=lambda f: (-os.path.getsize(f), order[f])):
+        size, shard_id = heapq.heappop(bins)
+        shards[shard_id].append(file)
+        heapq.heappush(bins, (size + os.path.getsize(file), shard_id))
+
+    return [sorted(shard, key=order.get) for shard in shards if shard]
+
+
+def extract_shard(files: List[str]) -> Dict:
+    """
+    Extract classes and AST trees of a shard.
+
+    Returns:
+        Dict: Extraction record with the shard "classes" and "file_trees".
+    """
+    codebase_analyzer = CodebaseAnalyzer()
+    for file in files:
+        codebase_analyzer.analyze_file(file)
+    return {'classes': codebase_analyzer.classes, 'file_trees': codebase_analyzer.file_trees}
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    """Parse a "host:port" string into a socket address."""
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def run_worker(address: Tuple[str, int], authkey: bytes, connect_retries: int = 50) -> int:
+    """
+    Run an extraction worker, which processes shards sent by the coordinator until it is done.
+
+    Args:
+        address (Tuple[str, int]): Coordinator address.
+        authkey (bytes): Key shared with the coordinator to authenticate the connection.
+        connect_retries (int): Attempts to connect while the coordinator is starting.
+
+    Returns:
+        int: Number of processed shards.
+    """
+    for attempt in range(connect_retries):
+        try:
+            connection = Client(address, authkey=authkey)
+            break
+        except ConnectionRefusedError:
+            if attempt == connect_retries - 1:
+                raise
+            sleep(0.1)
+
+    processed = 0
+    with connection:
+        while True:
+            try:
+                message = connection.recv()
+            except EOFError:
+                return processed
+            if message[0] == 'done':
+                return processed
+
+            _, shard_id, files = message
+            try:
+                connection.send(('result', shard_id, extract_shard(files)))
+            except Exception as e:
+                connection.send(('error', shard_id, str(e)))
+            processed += 1
+
+
+class ShardCoordinator:
+    """
+    Partitions a codebase into size-balanced shards, hands them out to extraction
+    workers over authenticated sockets and merges the returned records.
+
+    Workers are local processes started by the coordinator or remote hosts running
+    ``run.py worker``; remote hosts must see the codebase under the same paths.
+    """
+
+    def __init__(
+        self,
+        files: List[str],
+        num_shards: int,
+        address: Tuple[str, int] = ("127.0.0.1", 0),
+        authkey: Optional[bytes] = None,
+        max_retries: int = 2,
+        shard_timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Args:
+            files (List[str]): Paths of the files to extract.
+            num_shards (int): Number of shards.
+            address (Tuple[str, int]): Address to listen on, port 0 picks a free port.
+            authkey (Optional[bytes]): Key shared with workers, generated if not provided.
+            max_retries (int): Number of times a failed shard is handed out again.
+            shard_timeout (Optional[float]): Seconds to wait for a shard result before retrying.
+        """
+        self.files = files
+        self.shards = partition_files(files, num_shards)
+        self.authkey = authkey or secrets.token_bytes(32)
+        self.max_retries = max_retries
+        self.shard_timeout = shard_timeout
+
+        self.listener = Listener(address, authkey=self.authkey)
+        self.address = self.listener.address
+
+        self._pending = Queue()
+        for shard_id in range(len(self.shards)):
+            self._pending.put(shard_id)
+        self._attempts = [0] * len(self.shards)
+        self._records: Dict[int, Dict] = {}
+        self._failed: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+        if not self.shards:
+            self._finished.set()
+
+    def _complete(self, shard_id: int, record: Dict) -> None:
+        """Store the record of a completed shard."""
+        with self._lock:
+            self._records[shard_id] = record
+            self._check_finished()
+
+    def _retry(self, shard_id: int, reason: str) -> None:
+        """Hand a failed shard out again, or give up after max_retries attempts."""
+        with self._lock:
+            self._attempts[shard_id] += 1
+            if self._attempts[shard_id] <= self.max_retries:
+                logger.warning(f"Retrying shard {shard_id}: {reason}")
+                self._pending.put(shard_id)
+            else:
+                self._failed[shard_id] = reason
+                self._check_finished()
+
+    def _check_finished(self) -> None:
+        """Signal completion once every shard succeeded or failed; called under the lock."""
+        if len(self._records) + len(self._failed) == len(self.shards):
+            self._finished.set()
+
+    def _serve(self, connection: Connection) -> None:
+        """Hand out shards to a single worker connection until all shards are done."""
+        with connection:
+            while not self._finished.is_set():
+                try:
+                    shard_id = self._pending.get(timeout=0.1)
+                except Empty:
+                    continue
+
+                try:
+                    connection.send(('task', shard_id, self.shards[shard_id]))
+                    if self.shard_timeout is not None and not connection.poll(self.shard_timeout):
+                        raise TimeoutError(f"no result in {self.shard_timeout} seconds")
+                    status, _, payload = connection.recv()
+                except Exception as e:
+                    # The worker is lost, its shard goes back to the queue
+                    self._retry(shard_id, f"{type(e).__name__}: {e}")
+                    return
+
+                if status == 'result':
+                    self._complete(shard_id, payload)
+                else:
+                    self._retry(shard_id, payload)
+
+            try:
+                connection.send(('done',))
+            except OSError:
+                pass
+
+    def _accept(self) -> None:
+        """Accept worker connections, serving each one in its own thread."""
+        while not self._finished.is_set():
+            try:
+                connection = self.listener.accept()
+            except OSError:
+                return  # Listener closed
+            except Exception as e:
+                logger.warning(f"Rejected worker connection: {e}")
+                continue
+            threading.Thread(target=self._serve, args=(connection,), daemon=True).start()
+
+    def run(self, num_local_workers: int = 0, timeout: Optional[float] = None) -> CodebaseAnalyzer:
+        """
+        Run the sharded extraction.
+
+        Args:
+            num_local_workers (int): Number of local worker processes to start.
+            timeout (Optional[float]): Seconds to wait for all shards.
+
+        Returns:
+            CodebaseAnalyzer: Analyzer holding merged classes and AST trees of all shards.
+        """
+        accept_thread = threading.Thread(target=self._accept, daemon=True)
+        accept_thread.start()
+
+        # Spawned rather than forked, forking a multi-threaded process may deadlock the child
+        context = multiprocessing.get_context("spawn")
+        workers = [
+            context.Process(target=run_worker, args=(self.address, self.authkey), daemon=True)
+            for _ in range(num_local_workers)
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            waited = 0.0
+            while not self._finished.wait(0.5):
+                waited += 0.5
+                if timeout is not None and waited >= timeout:
+                    raise TimeoutError(f"Sharded extraction did not finish in {timeout} seconds")
+                if workers and not any(worker.is_alive() for worker in workers):
+                    raise RuntimeError("All local workers exited before the extraction finished")
+        finally:
+            self.listener.close()
+            for worker in workers:
+                worker.join(timeout=5)
+                if worker.is_alive():
+                    worker.terminate()
+
+        if self._failed:
+            failures = "; ".join(f"shard {shard_id}: {reason}" for shard_id, reason in sorted(self._failed.items()))
+            raise RuntimeError(f"Sharded extraction failed after retries ({failures})")
+
+        return self.merge()
+
+    def merge(self) -> CodebaseAnalyzer:
+        """Merge shard records into a CodebaseAnalyzer, keeping the original file order."""
+        file_trees = {}
+        classes_by_file = {}
+        for record in self._records.values():
+            file_trees.update(record['file_trees'])
+            for key, class_info in record['classes'].items():
+                classes_by_file.setdefault(class_info['file'], {})[key] = class_info
+
+        codebase_analyzer = CodebaseAnalyzer()
+        for file in self.files:
+            if file in file_trees:
+                codebase_analyzer.file_trees[file] = file_trees[file]
+            codebase_analyzer.classes.update(classes_by_file.get(file, {}))
+        return codebase_analyzer
+
+
+def extract_sharded(
+    directory: str,
+    num_shards: int,
+    num_local_workers: Optional[int] = None,
+    address: Tuple[str, int] = ("127.0.0.1", 0),
+    authkey: Optional[bytes] = None,
+    shard_timeout: Optional[float] = DEFAULT_SHARD_TIMEOUT,
+) -> CodebaseAnalyzer:
+    """
+    Extract a codebase directory in size-balanced shards handed out to worker processes or hosts.
+
+    Args:
+        directory (str): Codebase directory.
+        num_shards (int): Number of shards.
+        num_local_workers (Optional[int]): Number of local worker processes, one per shard by default.
+        address (Tuple[str, int]): Address the coordinator listens on for remote workers.
+        authkey (Optional[bytes]): Key shared with remote workers, required without local workers.
+        shard_timeout (Optional[float]): Seconds to wait for a shard result before retrying it
+            on another worker, so stalled workers do not block the extraction.
+
+    Returns:
+        CodebaseAnalyzer: Analyzer holding merged classes and AST trees of all shards.
+    """
+    num_local_workers = num_shards if num_local_workers is None else num_local_workers
+    if num_local_workers < 1 and authkey is None:
+        raise ValueError("SHARD_AUTHKEY must be set when no local workers are started")
+
+    coordinator = ShardCoordinator(
+        CodebaseAnalyzer.collect_python_files(directory), num_shards, address, authkey,
+        shard_timeout=shard_timeout,
+    )
+    print(f"Coordinator listening on {coordinator.address[0]}:{coordinator.address[1]}")
+    return coordinator.run(num_local_workers)
@@ -1,6 +1,5 @@
 import os
 import re
-import git
 import shutil
 from pathlib import Path
 from datetime import datetime
@@ -40,6 +39,8 @@ class Helper:
             ssh_repo_url (str): The SSH URL of the repository.
             clone_dir (Path): The directory where the repository will be cloned.
         """
+        import git  # Imported lazily, GitPython is only needed when cloning
+
         try:
             if not os.path.exists(clone_dir):
                 os.makedirs(clone_dir)
@@ -52,6 +53,28 @@ class Helper:
         except git.GitCommandError as e:
             print(f"Error cloning repository: {e}")
 
+    @staticmethod
+    def clone_repository(ssh_link: str, clone_dir: Path) -> Path:
+        """
+        Validate the SSH link and clone the repository into a subdirectory named after it.
+
+        Args:
+            ssh_link (str): The SSH link of the repository.
+            clone_dir (Path): The directory where repositories are cloned.
+
+        Returns:
+            Path: Path to the local codebase directory.
+        """
+        Helper.create_if_not_exists(clone_dir)
+
+        ssh_link = Helper.validate_ssh_link(ssh_link)
+        repo_name = ssh_link.split(":")[-1].split("/")[-1]
+        codebase_local_dir_path = Path(clone_dir) / repo_name
+
+        Helper.ssh_clone_repository(ssh_link, codebase_local_dir_path)
+
+        return codebase_local_dir_path
+
     @staticmethod
     def write_to_file(file_path: Path, content: str, backup_if_exists: bool = True) -> None:
         """
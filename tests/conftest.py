@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# Nodes and agents import their siblings the way run.py does, with src on the module search path
+SRC_DIR = str(Path(__file__).resolve().parent.parent / "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
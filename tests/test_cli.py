@@ -0,0 +1,84 @@
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from src.cli import build_parser
+
+RUN_SCRIPT = Path(__file__).resolve().parent.parent / "src" / "run.py"
+HEAVY_MODULES = {"langgraph", "langchain", "langchain_core", "langchain_openai", "networkx", "git"}
+
+
+def imported_modules(stderr: str) -> set:
+    """Collect top-level module names from ``-X importtime`` output."""
+    return {
+        line.rsplit("|", 1)[-1].strip().split(".")[0]
+        for line in stderr.splitlines()
+        if line.startswith("import time:") and "[us]" not in line
+    }
+
+
+class TestCli(unittest.TestCase):
+    def test_parse_extract_arguments(self):
+        """Test that the extract subcommand accepts a local codebase path."""
+        args = build_parser().parse_args(["extract", "--path", "codebase", "--traces-dir", "traces"])
+
+        self.assertEqual(args.command, "extract")
+        self.assertEqual(args.path, Path("codebase"))
+        self.assertEqual(args.traces_dir, Path("traces"))
+        self.assertIsNone(args.repo)
+
+    def test_parse_requires_codebase_source(self):
+        """Test that path and repo arguments are mutually exclusive and required."""
+        parser = build_parser()
+        with self.assertRaises(SystemExit):
+            parser.parse_args(["graph"])
+        with self.assertRaises(SystemExit):
+            parser.parse_args(["graph", "--path", "codebase", "--repo", "git@host:org/repo.git"])
+
+    def test_parse_report_arguments(self):
+        """Test that the report subcommand reads a saved analysis."""
+        args = build_parser().parse_args(
+            ["report", "--analysis", "llm_analyze.txt", "--report-dir", "reports", "--report-name", "summary"]
+        )
+
+        self.assertEqual(args.analysis, Path("llm_analyze.txt"))
+        self.assertEqual(args.report_dir, Path("reports"))
+        self.assertEqual(args.report_name, "summary")
+
+    def test_parse_rejects_non_positive_streaming_limits(self):
+        """Test that streaming limits below 1 are rejected."""
+        parser = build_parser()
+        for flag in ("--min-component-classes", "--max-queued-components", "--max-concurrency"):
+            with self.subTest(flag=flag), self.assertRaises(SystemExit):
+                parser.parse_args(["all", "--path", "codebase", "--stream", flag, "0"])
+
+        args = parser.parse_args(["all", "--path", "codebase", "--stream", "--max-concurrency", "2"])
+        self.assertEqual(args.max_concurrency, 2)
+
+    def test_extract_does_not_import_heavy_modules(self):
+        """Test that the extract stage runs without importing LLM and graph dependencies."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            codebase_dir = Path(tmp_dir) / "sample"
+            codebase_dir.mkdir()
+            (codebase_dir / "sample.py").write_text(
+                "class Sample:\n    def run(self) -> None:\n        pass\n", encoding="utf-8"
+            )
+
+            result = subprocess.run(
+                [
+                    sys.executable, "-X", "importtime", str(RUN_SCRIPT), "extract",
+                    "--path", str(codebase_dir), "--traces-dir", str(Path(tmp_dir) / "traces"),
+                ],
+                capture_output=True,
+                text=True,
+                cwd=tmp_dir,
+            )
+
+        self.assertEqual(result.returncode, 0, result.stdout)
+        self.assertIn("Extracted 1 classes from 1 files", result.stdout)
+        self.assertFalse(imported_modules(result.stderr) & HEAVY_MODULES)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import json
+import os
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from src.utils.clients import OpenAIClient, TieredClient
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    """A fake OpenAI-compatible chat completions endpoint, answering with the requested model name."""
+
+    requested_models = []
+    delay = 0.0
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with FakeOpenAIHandler.lock:
+            FakeOpenAIHandler.requested_models.append(body["model"])
+            FakeOpenAIHandler.in_flight += 1
+            FakeOpenAIHandler.max_in_flight = max(FakeOpenAIHandler.max_in_flight, FakeOpenAIHandler.in_flight)
+        time.sleep(FakeOpenAIHandler.delay)
+        with FakeOpenAIHandler.lock:
+            FakeOpenAIHandler.in_flight -= 1
+        payload = json.dumps({
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": body["model"],
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": f"answer from {body['model']}"},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestTieredClients(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOpenAIHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}/v1"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """Configure fast and strong tiers against the fake endpoint."""
+        FakeOpenAIHandler.requested_models.clear()
+        FakeOpenAIHandler.delay = 0.0
+        FakeOpenAIHandler.max_in_flight = 0
+        OpenAIClient._tiers = {}
+        self.env = patch.dict(os.environ, {
+            "MODEL_NAME": "default-model",
+            "API_KEY": "test-key",
+            "BASE_URL": self.base_url,
+            "FAST_MODEL_NAME": "fast-model",
+            "STRONG_MODEL_NAME": "strong-model",
+            "FAST_MAX_CONCURRENCY": "2",
+        })
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        OpenAIClient._tiers = {}
+
+    def test_tiers_route_to_their_models(self):
+        """Test that each tier is bound to its own model and falls back to default settings."""
+        fast = OpenAIClient.get_tier("fast")
+        strong = OpenAIClient.get_tier("strong")
+
+        self.assertEqual(fast.invoke("prompt").content, "answer from fast-model")
+        self.assertEqual(strong.invoke("prompt").content, "answer from strong-model")
+        self.assertIs(fast.escalate_to, strong)
+        self.assertIsNone(strong.escalate_to)
+        self.assertEqual(FakeOpenAIHandler.requested_models, ["fast-model", "strong-model"])
+
+    def test_escalates_when_validation_fails(self):
+        """Test that an invalid fast tier response is retried with the strong tier."""
+        response = OpenAIClient.get_tier("fast").invoke(
+            "prompt", lambda message: "strong" in message.content
+        )
+
+        self.assertEqual(response.content, "answer from strong-model")
+        self.assertEqual(FakeOpenAIHandler.requested_models, ["fast-model", "strong-model"])
+        self.assertEqual(OpenAIClient.get_tier("fast").usage['escalations'], 1)
+        self.assertEqual(OpenAIClient.get_tier("strong").usage['escalations'], 0)
+
+    def test_usage_is_reported_per_tier(self):
+        """Test that requests and token usage are recorded for each tier."""
+        fast = OpenAIClient.get_tier("fast")
+        fast.invoke("prompt")
+        fast.invoke("prompt")
+
+        self.assertEqual(fast.usage['requests'], 2)
+        self.assertEqual(fast.usage['input_tokens'], 20)
+        self.assertEqual(fast.usage['output_tokens'], 10)
+        self.assertIn("- fast (fast-model): 2 requests, 0 escalations", OpenAIClient.usage_to_string())
+        self.assertIn("- strong (strong-model): 0 requests", OpenAIClient.usage_to_string())
+
+    def test_tier_caps_concurrent_requests(self):
+        """Test that the fast tier sends at most FAST_MAX_CONCURRENCY requests at a time."""
+        FakeOpenAIHandler.delay = 0.1
+        fast = OpenAIClient.get_tier("fast")
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            responses = list(executor.map(fast.invoke, ["prompt"] * 6))
+
+        self.assertEqual([response.content for response in responses], ["answer from fast-model"] * 6)
+        self.assertEqual(FakeOpenAIHandler.max_in_flight, 2)
+
+    def test_rejects_non_positive_limits(self):
+        """Test that tier limits below 1 are rejected instead of blocking every request."""
+        for key in ("FAST_MAX_CONCURRENCY", "FAST_REQUESTS_PER_MINUTE"):
+            with self.subTest(key=key), patch.dict(os.environ, {key: "0"}):
+                with self.assertRaises(ValueError):
+                    TieredClient.from_env("fast")
+
+    def test_unknown_tier(self):
+        """Test that an unknown tier is rejected."""
+        with self.assertRaises(ValueError):
+            OpenAIClient.get_tier("medium")
+
+    def test_tier_without_escalation_returns_invalid_response(self):
+        """Test that the strongest tier returns its response even if validation fails."""
+        client = TieredClient.from_env("strong")
+
+        self.assertEqual(client.invoke("prompt", lambda message: False).content, "answer from strong-model")
+        self.assertEqual(client.usage['escalations'], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import tempfile
+import unittest
+from pathlib import Path
+from networkx import DiGraph
+from src.utils.graph_snapshot import GraphSnapshot
+
+
+class TestGraphSnapshot(unittest.TestCase):
+    def setUp(self):
+        """Set up a methods graph, class info and a snapshot path for testing."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "methods_graph.snap"
+
+        self.graph = DiGraph()
+        self.graph.add_node("b.py:B:run", name="run", class_name="B", file="b.py", args=["self:Any"],
+                            return_type="None", docstring="Runs — ünïcode.", calls=["save"])
+        self.graph.add_node("a.py:A:save", name="save", class_name="A", file="a.py", args=[],
+                            return_type="bool", docstring=None, calls=[])
+        self.graph.add_node("b.py:B:save", name="save", class_name="B", file="b.py", args=[],
+                            return_type=None, docstring=None, calls=[])
+        self.graph.add_edge("b.py:B:run", "a.py:A:save", type="call")
+        self.graph.add_edge("b.py:B:save", "a.py:A:save", type="overrides")
+
+        self.classes = {
+            "b.py:B": {"name": "B", "file": "b.py", "line": 1, "bases": ["A"], "methods": []},
+            "a.py:A": {"name": "A", "file": "a.py", "line": 3, "bases": [], "methods": []},
+        }
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_round_trip(self):
+        """Test that a snapshot decodes into the same graph and classes."""
+        GraphSnapshot.write(self.path, self.graph, self.classes, {"codebase_dir": "/repo"})
+
+        with GraphSnapshot.open(self.path) as snapshot:
+            graph = snapshot.to_digraph()
+            classes = snapshot.to_classes()
+            metadata = snapshot.metadata
+
+        self.assertEqual(dict(graph.nodes(data=True)), dict(self.graph.nodes(data=True)))
+        self.assertEqual(sorted(graph.edges(data=True)), sorted(self.graph.edges(data=True)))
+        self.assertEqual(list(classes.items()), list(self.classes.items()))
+        self.assertEqual(metadata, {"codebase_dir": "/repo"})
+
+    def test_lazy_access(self):
+        """Test that nodes, edges and classes are accessible without decoding the whole snapshot."""
+        GraphSnapshot.write(self.path, self.graph, self.classes)
+
+        with GraphSnapshot.open(self.path) as snapshot:
+            self.assertEqual((snapshot.num_nodes, snapshot.num_edges, snapshot.num_classes), (3, 2, 2))
+
+            run = snapshot.node_index("b.py:B:run")
+            self.assertEqual(snapshot.node_id(run), "b.py:B:run")
+            self.assertEqual((snapshot.node_name(run), snapshot.node_class(run), snapshot.node_file(run)),
+                             ("run", "B", "b.py"))
+            self.assertEqual(snapshot.node_attrs(run)["docstring"], "Runs — ünïcode.")
+            self.assertEqual(
+                [(snapshot.node_id(target), edge_type) for target, edge_type in snapshot.out_edges(run)],
+                [("a.py:A:save", "call")],
+            )
+            self.assertEqual(snapshot.successors(snapshot.node_index("a.py:A:save")), [])
+
+            self.assertEqual(snapshot.class_keys(), ["a.py:A", "b.py:B"])
+            self.assertEqual(snapshot.class_info("b.py:B"), self.classes["b.py:B"])
+
+            with self.assertRaises(KeyError):
+                snapshot.node_index("c.py:C:missing")
+            with self.assertRaises(KeyError):
+                snapshot.class_info("c.py:C")
+
+    def test_empty_graph(self):
+        """Test that an empty graph and class index can be written and opened."""
+        GraphSnapshot.write(self.path, DiGraph(), {})
+
+        with GraphSnapshot.open(self.path) as snapshot:
+            self.assertEqual(snapshot.num_nodes, 0)
+            self.assertEqual(len(snapshot.to_digraph().nodes), 0)
+            self.assertEqual(snapshot.to_classes(), {})
+
+    def test_invalid_file(self):
+        """Test that a file which is not a snapshot is rejected."""
+        self.path.write_bytes(b"digraph MethodGraph {}\n" * 10)
+
+        with self.assertRaises(ValueError):
+            GraphSnapshot.open(self.path)
+
+    def test_truncated_file(self):
+        """Test that a snapshot cut anywhere after its header is rejected when opened."""
+        GraphSnapshot.write(self.path, self.graph, self.classes, {"codebase_dir": "/repo"})
+        data = self.path.read_bytes()
+
+        for size in range(len(data) - 1, 0, -7):
+            self.path.write_bytes(data[:size])
+            with self.subTest(size=size), self.assertRaisesRegex(ValueError, "Invalid snapshot file"):
+                GraphSnapshot.open(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
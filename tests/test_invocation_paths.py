@@ -0,0 +1,122 @@
+import unittest
+from networkx import DiGraph
+from src.utils.invocation_paths import InvocationPathFinder
+
+
+class TestInvocationPathFinder(unittest.TestCase):
+    def setUp(self):
+        """Set up a methods graph for testing."""
+        self.graph = DiGraph()
+        for name, class_name, decorators in [
+            ("main", "App", []),
+            ("process", "Service", []),
+            ("save", "Repository", []),
+            ("ping", "Repository", []),
+            ("pong", "Repository", []),
+            ("index", "Views", ["app.route('/')"]),
+            ("submit", "Views", ["app.post('/submit')"]),
+            ("unused", "Views", []),
+        ]:
+            self.graph.add_node(
+                f"{class_name}:{name}", name=name, class_name=class_name, decorators=decorators
+            )
+        self.graph.add_edge("App:main", "Service:process", type="call")
+        self.graph.add_edge("Service:process", "Repository:save", type="call")
+        self.graph.add_edge("Service:process", "Repository:ping", type="call")
+        self.graph.add_edge("Repository:ping", "Repository:pong", type="call")
+        self.graph.add_edge("Repository:pong", "Repository:ping", type="call")
+        self.graph.add_edge("Views:unused", "Service:process", type="overrides")
+        self.graph.add_edge("Service:process", "Views:index", type="call")
+        self.graph.add_edge("Views:submit", "Repository:save", type="call")
+
+    def test_find_entry_points(self):
+        """Test that entry points include main and framework handlers, which call other methods."""
+        entry_points = InvocationPathFinder(self.graph).find_entry_points()
+
+        self.assertEqual(entry_points, ["App:main", "Views:submit"])
+
+    def test_find_entry_points_prioritizes_main_over_uncalled_methods(self):
+        """Test that many isolated methods neither become entry points nor starve main."""
+        graph = DiGraph()
+        graph.add_node("App:main", name="main", class_name="App")
+        graph.add_node("App:run", name="run", class_name="App")
+        graph.add_edge("App:main", "App:run", type="call")
+        for index in range(200):
+            graph.add_node(f"Aaa:helper_{index:03}", name=f"helper_{index:03}", class_name="Aaa")
+
+        finder = InvocationPathFinder(graph)
+
+        self.assertEqual(finder.find_entry_points(), ["App:main"])
+        self.assertEqual(
+            [path['steps'] for path in finder.find_paths()], [[["App:main"], ["App:run"]]]
+        )
+
+    def test_is_handler_ignores_generic_decorators(self):
+        """Test that generic decorator names count only on a framework-looking receiver."""
+        self.assertTrue(InvocationPathFinder.is_handler({'decorators': ["app.get('/orders')"]}))
+        self.assertTrue(InvocationPathFinder.is_handler({'decorators': ["router.patch('/orders')"]}))
+        self.assertFalse(InvocationPathFinder.is_handler({'decorators': ["patch('app.orders.save')"]}))
+        self.assertFalse(InvocationPathFinder.is_handler({'decorators': ["mock.patch.object(Service, 'run')"]}))
+        self.assertFalse(InvocationPathFinder.is_handler({'decorators': ["client.get"]}))
+
+    def test_find_paths_reaches_main_before_decorated_tests(self):
+        """Test that test methods decorated with patch do not use up the paths limit before main."""
+        graph = DiGraph()
+        graph.add_node("app/cli.py:App:main", name="main", class_name="App")
+        graph.add_node("app/cli.py:App:run", name="run", class_name="App")
+        graph.add_edge("app/cli.py:App:main", "app/cli.py:App:run", type="call")
+        for index in range(60):
+            test_id = f"a_tests/test_app.py:TestApp:test_{index:02}"
+            graph.add_node(test_id, name=f"test_{index:02}", class_name="TestApp",
+                           decorators=["patch('app.cli.App.run')", "mock.patch.object(App, 'run')"])
+            graph.add_edge(test_id, "app/cli.py:App:run", type="call")
+
+        paths = InvocationPathFinder(graph, max_paths=10).find_paths()
+
+        self.assertEqual(paths[0]['entry'], "app/cli.py:App:main")
+
+    def test_find_paths_caps_paths_per_entry_point(self):
+        """Test that a single entry point does not use up the total paths limit."""
+        paths = InvocationPathFinder(self.graph, max_paths_per_entry=1).find_paths()
+
+        self.assertEqual([path['entry'] for path in paths], ["App:main", "Views:submit"])
+
+    def test_find_paths_condenses_cycles(self):
+        """Test that paths follow call edges only and collapse recursive cycles."""
+        paths = InvocationPathFinder(self.graph).find_paths()
+        main_paths = [path['steps'] for path in paths if path['entry'] == "App:main"]
+
+        self.assertEqual(main_paths, [
+            [["App:main"], ["Service:process"], ["Repository:ping", "Repository:pong"]],
+            [["App:main"], ["Service:process"], ["Repository:save"]],
+            [["App:main"], ["Service:process"], ["Views:index"]],
+        ])
+
+    def test_find_paths_respects_limits(self):
+        """Test that paths are cut at the depth limit and their number is bounded."""
+        paths = InvocationPathFinder(self.graph, max_depth=2, max_paths=1).find_paths()
+
+        self.assertEqual(len(paths), 1)
+        self.assertEqual(paths[0]['steps'], [["App:main"], ["Service:process"]])
+        self.assertTrue(paths[0]['truncated'])
+
+    def test_serialize_paths_to_string(self):
+        """Test that paths serialize to compact chains of method labels."""
+        paths = InvocationPathFinder(self.graph, max_depth=3, max_paths=2).find_paths()
+
+        result = InvocationPathFinder.serialize_paths_to_string(self.graph, paths)
+        expected = (
+            "Method Invocation Paths:\n"
+            "- App.main -> Service.process -> {Repository.ping <-> Repository.pong}\n"
+            "- App.main -> Service.process -> Repository.save"
+        )
+        self.assertEqual(result, expected)
+
+    def test_serialize_paths_to_string_no_paths(self):
+        """Test that serialize_paths_to_string handles an empty path list."""
+        result = InvocationPathFinder.serialize_paths_to_string(self.graph, [])
+        self.assertEqual(result, "Method Invocation Paths: None")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from src.utils.pipeline import PackageStreamer
+
+
+class TestPackageStreamer(unittest.TestCase):
+    def setUp(self):
+        """Create a codebase with three packages of two classes each."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        for package in ("a", "b", "c"):
+            package_dir = self.root / package
+            package_dir.mkdir()
+            (package_dir / "module.py").write_text(
+                f"class {package.upper()}1:\n    pass\n\nclass {package.upper()}2:\n    pass\n",
+                encoding="utf-8",
+            )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_streams_one_component_per_package(self):
+        """Test that every package becomes a component once it holds enough classes."""
+        components = list(PackageStreamer(str(self.root), min_component_classes=1))
+
+        self.assertEqual(len(components), 3)
+        self.assertEqual(
+            sorted(Path(component['packages'][0]).name for component in components), ["a", "b", "c"]
+        )
+        self.assertTrue(all(len(component['analyzer'].classes) == 2 for component in components))
+
+    def test_groups_small_packages(self):
+        """Test that small packages are grouped into components, the remainder is emitted last."""
+        components = list(PackageStreamer(str(self.root), min_component_classes=4))
+
+        self.assertEqual([len(component['packages']) for component in components], [2, 1])
+
+    def test_merge_components(self):
+        """Test that merged components hold all classes and trees."""
+        codebase_analyzer = PackageStreamer.merge(list(PackageStreamer(str(self.root), min_component_classes=1)))
+
+        self.assertEqual(len(codebase_analyzer.classes), 6)
+        self.assertEqual(len(codebase_analyzer.file_trees), 3)
+
+    def test_backpressure_bounds_parsed_components(self):
+        """Test that parsing stops while the queue is full and the consumer is busy."""
+        for package in ("d", "e", "f"):
+            (self.root / package).mkdir()
+            (self.root / package / "module.py").write_text(f"class {package.upper()}:\n    pass\n", encoding="utf-8")
+        streamer = PackageStreamer(str(self.root), min_component_classes=1, max_queued_components=1)
+        components = iter(streamer)
+
+        next(components)
+        time.sleep(0.3)
+
+        # One component taken, one queued and one waiting for a free queue slot
+        self.assertLessEqual(streamer.produced, 3)
+        self.assertEqual(streamer.queue.qsize(), 1)
+        self.assertEqual(len(list(components)), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import unittest
+from pathlib import Path
+from networkx import DiGraph
+from src.utils.report_renderer import ReportRenderer
+
+
+class TestReportRenderer(unittest.TestCase):
+    def setUp(self):
+        """Set up extracted classes and a methods graph for testing."""
+        self.classes = {
+            "/repo/app/orders.py:OrderService": {
+                "name": "OrderService",
+                "file": "/repo/app/orders.py",
+                "line": 3,
+                "bases": ["BaseService"],
+                "methods": [
+                    {"name": "place", "args": [{"name": "self", "type": None}, {"name": "order", "type": "Order"}],
+                     "return_type": "bool", "calls": ["save"]},
+                    {"name": "cancel", "args": [], "return_type": None, "calls": []},
+                ],
+            },
+            "/repo/app/storage.py:Repository": {
+                "name": "Repository",
+                "file": "/repo/app/storage.py",
+                "line": 10,
+                "bases": [],
+                "methods": [{"name": "save", "args": [], "return_type": None, "calls": []}],
+            },
+        }
+        self.graph = DiGraph()
+        self.graph.add_node("/repo/app/orders.py:OrderService:place", name="place", class_name="OrderService")
+        self.graph.add_node("/repo/app/orders.py:OrderService:cancel", name="cancel", class_name="OrderService")
+        self.graph.add_node("/repo/app/storage.py:Repository:save", name="save", class_name="Repository")
+        self.graph.add_edge(
+            "/repo/app/orders.py:OrderService:place", "/repo/app/storage.py:Repository:save", type="call"
+        )
+
+    def test_parse_class_descriptions(self):
+        """Test that class descriptions are parsed by class number and removed from the insights."""
+        text = (
+            "Key functionalities: ordering.\n\n"
+            "CLASS DESCRIPTIONS:\n"
+            "1 | Places and cancels orders | Order management\n"
+            "[2] | Persists entities | Storage |\n"
+            "7 | Unknown class | Ignored\n"
+        )
+
+        insights, descriptions = ReportRenderer.parse_class_descriptions(text, self.classes, "CLASS DESCRIPTIONS:")
+
+        self.assertEqual(insights, "Key functionalities: ordering.")
+        self.assertEqual(descriptions, {
+            "/repo/app/orders.py:OrderService": {
+                "functionality": "Places and cancels orders", "business_process": "Order management"
+            },
+            "/repo/app/storage.py:Repository": {
+                "functionality": "Persists entities", "business_process": "Storage"
+            },
+        })
+
+    def test_parse_class_descriptions_table_rows(self):
+        """Test that descriptions written as Markdown table rows are parsed."""
+        text = (
+            "Insights\n\n"
+            "CLASS DESCRIPTIONS:\n"
+            "| # | Functionality | Business Process |\n"
+            "|---|---|---|\n"
+            "| 2 | Persists entities | Storage |\n"
+        )
+
+        _, descriptions = ReportRenderer.parse_class_descriptions(text, self.classes, "CLASS DESCRIPTIONS:")
+
+        self.assertEqual(descriptions, {
+            "/repo/app/storage.py:Repository": {
+                "functionality": "Persists entities", "business_process": "Storage"
+            },
+        })
+
+    def test_parse_class_descriptions_warns_when_nothing_parsed(self):
+        """Test that a descriptions block without parsable lines is logged."""
+        with self.assertLogs("src.utils.report_renderer", level="WARNING"):
+            _, descriptions = ReportRenderer.parse_class_descriptions(
+                "Insights\n\nCLASS DESCRIPTIONS:\nOrderService places orders.", self.classes, "CLASS DESCRIPTIONS:"
+            )
+        self.assertEqual(descriptions, {})
+
+    def test_parse_class_descriptions_without_marker(self):
+        """Test that a response without the descriptions block is returned unchanged."""
+        insights, descriptions = ReportRenderer.parse_class_descriptions("Insights", self.classes, "CLASS DESCRIPTIONS:")
+
+        self.assertEqual(insights, "Insights")
+        self.assertEqual(descriptions, {})
+
+    def test_render_classes_table(self):
+        """Test that the table is rendered from extracted data and merged descriptions."""
+        descriptions = {
+            "/repo/app/orders.py:OrderService": {
+                "functionality": "Places orders", "business_process": "Order management"
+            },
+        }
+
+        result = ReportRenderer.render_classes_table(self.classes, self.graph, descriptions, Path("/repo"))
+        expected = (
+            "| **File Path** | **Class** | **Methods** | **Arguments** | **Returns** "
+            "| **Dependencies** | **Functionality** | **Business Process** |\n"
+            "|---|---|---|---|---|---|---|---|\n"
+            "| app/orders.py | OrderService | place<br>cancel | self: Any, order: Order<br>() | bool<br>None "
+            "| BaseService<br>Repository | Places orders | Order management |\n"
+            "| app/storage.py | Repository | save | () | None | - | - | - |\n"
+        )
+        self.assertEqual(result, expected)
+
+    def test_serialize_class_descriptions(self):
+        """Test that serialized descriptions are parsed back by class number."""
+        descriptions = {
+            "/repo/app/storage.py:Repository": {
+                "functionality": "Persists entities", "business_process": "Storage"
+            },
+        }
+
+        block = ReportRenderer.serialize_class_descriptions(self.classes, descriptions, "CLASS DESCRIPTIONS:")
+
+        self.assertEqual(block, "CLASS DESCRIPTIONS:\n2 | Persists entities | Storage")
+        self.assertEqual(
+            ReportRenderer.parse_class_descriptions(f"Insights\n\n{block}", self.classes, "CLASS DESCRIPTIONS:"),
+            ("Insights", descriptions),
+        )
+
+    def test_render_code_links(self):
+        """Test that code links point to the class definition lines relative to the report file."""
+        result = ReportRenderer.render_code_links(self.classes, Path("/repo"), Path("/reports/repo"))
+        expected = (
+            "- **OrderService**: [app/orders.py](../../repo/app/orders.py#L3)\n"
+            "- **Repository**: [app/storage.py](../../repo/app/storage.py#L10)\n"
+        )
+        self.assertEqual(result, expected)
+
+    def test_render_empty_classes(self):
+        """Test that rendering handles a codebase without classes."""
+        self.assertEqual(ReportRenderer.render_classes_table({}), "No classes found.\n")
+        self.assertEqual(ReportRenderer.render_code_links({}), "No classes found.\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+from nodes.reporting import ReportNode
+
+SECTIONS = [
+    ("<!-- classes-table -->", "Classes and Methods Overview", "| table |\n"),
+    ("<!-- code-links -->", "Links to Corresponding Code Files", "- link\n"),
+]
+
+
+class TestReportNode(unittest.TestCase):
+    def test_insert_sections_replaces_quoted_placeholders(self):
+        """Test that placeholders wrapped in backticks are replaced together with the backticks."""
+        report = (
+            "## Classes and Methods Overview\n\n`<!-- classes-table -->`\n\n"
+            "## Links to Corresponding Code Files\n\n<!-- code-links -->\n"
+        )
+
+        result = ReportNode._insert_sections(report, SECTIONS)
+
+        self.assertEqual(
+            result,
+            "## Classes and Methods Overview\n\n| table |\n\n"
+            "## Links to Corresponding Code Files\n\n- link\n",
+        )
+
+    def test_insert_sections_under_existing_heading(self):
+        """Test that a section without placeholder replaces the content under its heading."""
+        report = (
+            "## Classes and Methods Overview\n\n| LLM table |\n\n---\n\n"
+            "## Conclusion\n\nDone.\n"
+        )
+
+        result = ReportNode._insert_sections(report, SECTIONS)
+
+        self.assertEqual(
+            result,
+            "## Classes and Methods Overview\n\n| table |\n\n---\n\n"
+            "## Conclusion\n\nDone.\n\n"
+            "## Links to Corresponding Code Files\n\n- link\n",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from multiprocessing.connection import Client
+from pathlib import Path
+from src.utils.codebase_analyzer import CodebaseAnalyzer
+from src.utils.sharding import ShardCoordinator, extract_sharded, partition_files, run_worker
+
+
+class TestSharding(unittest.TestCase):
+    def setUp(self):
+        """Create a codebase of files with different sizes."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        for package in ("a", "b"):
+            (self.root / package).mkdir()
+            for index in range(3):
+                methods = "".join(f"    def m{i}(self):\n        return self.m{i}\n" for i in range(index + 1))
+                (self.root / package / f"module{index}.py").write_text(
+                    f"class {package.upper()}{index}:\n{methods}", encoding="utf-8"
+                )
+        self.files = CodebaseAnalyzer.collect_python_files(str(self.root))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_partition_files_balances_sizes(self):
+        """Test that shards cover all files and have balanced sizes."""
+        shards = partition_files(self.files, 2)
+        sizes = [sum(os.path.getsize(file) for file in shard) for shard in shards]
+
+        self.assertEqual(sorted(file for shard in shards for file in shard), sorted(self.files))
+        self.assertLessEqual(max(sizes) - min(sizes), max(os.path.getsize(file) for file in self.files))
+
+    def test_partition_files_skips_empty_shards(self):
+        """Test that there are no more shards than files."""
+        self.assertEqual(len(partition_files(self.files[:2], 5)), 2)
+
+    def test_run_with_local_workers(self):
+        """Test that local worker processes produce the same result as a single analyzer."""
+        expected = CodebaseAnalyzer()
+        expected.analyze_directory(str(self.root))
+
+        codebase_analyzer = ShardCoordinator(self.files, 3).run(num_local_workers=2, timeout=60)
+
+        self.assertEqual(list(codebase_analyzer.classes), list(expected.classes))
+        self.assertEqual(codebase_analyzer.classes, expected.classes)
+        self.assertEqual(list(codebase_analyzer.file_trees), list(expected.file_trees))
+
+    def test_retries_shard_of_lost_worker(self):
+        """Test that a shard taken by a worker which disconnects is handed out again."""
+        coordinator = ShardCoordinator(self.files, 2, max_retries=1)
+
+        def lost_worker():
+            with Client(coordinator.address, authkey=coordinator.authkey) as connection:
+                connection.recv()
+
+        def workers():
+            lost = threading.Thread(target=lost_worker)
+            lost.start()
+            lost.join()
+            run_worker(coordinator.address, coordinator.authkey)
+
+        threading.Thread(target=workers, daemon=True).start()
+        codebase_analyzer = coordinator.run(timeout=60)
+
+        self.assertEqual(len(codebase_analyzer.classes), 6)
+        self.assertEqual(max(coordinator._attempts), 1)
+
+    def test_retries_shard_of_stalled_worker(self):
+        """Test that a shard taken by a worker which stalls with an open connection is handed out again."""
+        coordinator = ShardCoordinator(self.files, 2, max_retries=1, shard_timeout=0.5)
+        stalled = threading.Event()
+
+        def stalled_worker():
+            with Client(coordinator.address, authkey=coordinator.authkey) as connection:
+                connection.recv()
+                stalled.set()
+                time.sleep(5)
+
+        threading.Thread(target=stalled_worker, daemon=True).start()
+
+        def healthy_worker():
+            stalled.wait()
+            run_worker(coordinator.address, coordinator.authkey)
+
+        threading.Thread(target=healthy_worker, daemon=True).start()
+        codebase_analyzer = coordinator.run(timeout=30)
+
+        self.assertEqual(len(codebase_analyzer.classes), 6)
+        self.assertEqual(sorted(coordinator._attempts), [0, 1])
+
+    def test_fails_after_retries(self):
+        """Test that a shard failing more than max_retries times fails the extraction."""
+        coordinator = ShardCoordinator(self.files, 1, max_retries=0)
+
+        def lost_worker():
+            with Client(coordinator.address, authkey=coordinator.authkey) as connection:
+                connection.recv()
+
+        threading.Thread(target=lost_worker, daemon=True).start()
+
+        with self.assertRaises(RuntimeError):
+            coordinator.run(timeout=60)
+
+    def test_extract_sharded_requires_authkey_without_local_workers(self):
+        """Test that remote-only extraction fails instead of waiting for workers which cannot authenticate."""
+        with self.assertRaises(ValueError):
+            extract_sharded(str(self.root), 2, num_local_workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
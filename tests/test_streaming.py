@@ -0,0 +1,131 @@
+import re
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from langchain_core.messages.ai import AIMessage
+from nodes.streaming import StreamAnalyzeNode
+
+CLASS_LINE_PATTERN = re.compile(r"^- \[(\d+)\] \S+ \(name: (\w+),", re.MULTILINE)
+
+
+class StubClient:
+    """A model tier stub, which describes every class of the prompt and records concurrency."""
+
+    def __init__(self, delay: float = 0.05, failing_class: str = None, always_fail: bool = False):
+        self.delay = delay
+        self.failing_class = failing_class
+        self.always_fail = always_fail
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def invoke(self, prompt, validator=None):
+        with self._lock:
+            self.in_flight += 1
+            self.requests += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            classes = CLASS_LINE_PATTERN.findall(prompt)
+            if self.always_fail:
+                raise RuntimeError("endpoint is down")
+            if self.failing_class in {name for _, name in classes}:
+                raise RuntimeError(f"analysis of {self.failing_class} failed")
+            lines = [f"{index} | Handles {name} | Process of {name}" for index, name in classes]
+            return AIMessage(content="Component insights.\n\nCLASS DESCRIPTIONS:\n" + "\n".join(lines))
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class TestStreamAnalyzeNode(unittest.TestCase):
+    def setUp(self):
+        """Create a codebase with six packages of two classes each."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        self.codebase = self.root / "codebase"
+        for package in "abcdef":
+            package_dir = self.codebase / package
+            package_dir.mkdir(parents=True)
+            (package_dir / "models.py").write_text(
+                f"class {package.upper()}First:\n"
+                f"    def run(self):\n"
+                f"        self.helper()\n"
+                f"\n"
+                f"class {package.upper()}Second:\n"
+                f"    def helper(self):\n"
+                f"        pass\n",
+                encoding="utf-8",
+            )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _state(self):
+        return {
+            "codebase_local_dir_path": self.codebase,
+            "traces_local_dir_path": self.root / "traces",
+        }
+
+    def test_analyzes_components_with_bounded_concurrency(self):
+        """Test that components are analyzed at most max_concurrency at a time and their descriptions merged."""
+        client = StubClient()
+        node = StreamAnalyzeNode(client, min_component_classes=2, max_queued_components=1, max_concurrency=2)
+
+        result = node(self._state())
+
+        self.assertEqual(client.requests, 6)
+        self.assertEqual(client.max_in_flight, 2)
+        self.assertEqual(len(result["classes_info"]), 12)
+        self.assertEqual(
+            {key: value['functionality'] for key, value in result["class_descriptions"].items()},
+            {key: f"Handles {info['name']}" for key, info in result["classes_info"].items()},
+        )
+        self.assertNotIn("CLASS DESCRIPTIONS:", result["llm_analysis_result"].content)
+        self.assertNotIn("| **File Path** |", result["llm_analysis_result"].content)
+        self.assertEqual(result["llm_analysis_result"].content.count("### Packages:"), 6)
+        self.assertTrue((self.root / "traces" / "classes_table.md").is_file())
+
+    def test_failed_component_fails_the_node(self):
+        """Test that an exception of a component analysis is raised by the node."""
+        client = StubClient(failing_class="CFirst")
+        node = StreamAnalyzeNode(client, min_component_classes=2, max_queued_components=1, max_concurrency=2)
+
+        with self.assertRaisesRegex(RuntimeError, "analysis of CFirst failed"):
+            node(self._state())
+
+    def test_failed_component_stops_sending_components(self):
+        """Test that no further components are sent to the LLM once an analysis failed."""
+        client = StubClient(always_fail=True)
+        node = StreamAnalyzeNode(client, min_component_classes=2, max_queued_components=1, max_concurrency=1)
+
+        with self.assertRaisesRegex(RuntimeError, "endpoint is down"):
+            node(self._state())
+        self.assertEqual(client.requests, 1)
+
+    def test_codebase_without_classes(self):
+        """Test that a codebase of plain functions is extracted without LLM requests."""
+        codebase = self.root / "functions"
+        (codebase / "tools").mkdir(parents=True)
+        (codebase / "tools" / "helpers.py").write_text("def run():\n    return 1\n", encoding="utf-8")
+        client = StubClient()
+
+        result = StreamAnalyzeNode(client)({
+            "codebase_local_dir_path": codebase,
+            "traces_local_dir_path": self.root / "traces",
+        })
+
+        self.assertEqual(client.requests, 0)
+        self.assertEqual(result["classes_info"], {})
+        self.assertTrue(result["llm_analysis_result"].content)
+        self.assertEqual(
+            (self.root / "traces" / "llm_analyze.txt").read_text(encoding="utf-8"),
+            result["llm_analysis_result"].content,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()